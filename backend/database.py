@@ -5,7 +5,17 @@ from sqlalchemy.sql import func
 from datetime import datetime
 from config import settings
 
-engine = create_engine(settings.database_url)
+# Batch multi-row writes at the driver level: psycopg2's executemany is
+# one round-trip per row without this, and insertmanyvalues keeps bulk
+# inserts to a handful of multi-VALUES statements
+engine = create_engine(
+    settings.database_url,
+    executemany_mode='values_plus_batch',
+    insertmanyvalues_page_size=1000,
+    # Sync fan-out and the concurrent metrics rebuild each check out one
+    # connection per worker thread
+    pool_size=8
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -37,6 +47,25 @@ class PullRequest(Base):
     
     # Labels/Tags stored as JSON array
     labels = Column(JSON, default=list)
+    labels_lower = Column(JSON, default=list)  # Pre-lowercased at sync time for the label-status aggregations
+    pr_state_bucket = Column(String, index=True)  # Label-derived state bucket, computed at sync time for /api/pr-states
+
+    @property
+    def labels_lower_set(self):
+        """The PR's labels lowercased, as a frozenset, built once per instance.
+
+        Prefers the labels_lower column populated at sync time and falls
+        back to lowercasing for rows that predate it; every consumer in the
+        same session shares the one frozenset.
+        """
+        cached = self.__dict__.get('_labels_lower_set')
+        if cached is None:
+            source = self.labels_lower
+            if source is None:
+                source = (l.lower() for l in (self.labels or ()))
+            cached = frozenset(source)
+            self.__dict__['_labels_lower_set'] = cached
+        return cached
     
     # Requested reviewers (GitHub usernames) stored as JSON array
     requested_reviewers = Column(JSON, default=list)
@@ -330,6 +359,7 @@ class InterfaceMetrics(Base):
     all_medium_count = Column(Integer, default=0)
     weekly_stats = Column(JSON, default=dict)
     detailed_metrics = Column(JSON, default=dict)
+    content_hash = Column(String)  # Hash of computed values to skip unchanged rewrites
     last_updated = Column(DateTime, default=func.now())
 
 
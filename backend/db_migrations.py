@@ -775,6 +775,101 @@ def add_task_analysis_columns():
         logger.error(f" Error adding task analysis columns: {e}")
         return False
 
+def add_interface_metrics_content_hash():
+    """
+    Add content_hash column to interface_metrics table
+    Used to skip rewriting metrics rows whose computed values haven't changed
+    """
+    try:
+        logger.info("Checking for content_hash column in interface_metrics...")
+
+        if not column_exists('interface_metrics', 'content_hash'):
+            logger.info("Adding content_hash column to interface_metrics...")
+            with engine.connect() as connection:
+                connection.execute(text(
+                    "ALTER TABLE interface_metrics ADD COLUMN content_hash VARCHAR"
+                ))
+                connection.commit()
+                logger.info(" Added content_hash column")
+        else:
+            logger.info(" content_hash column already exists")
+
+        return True
+
+    except Exception as e:
+        logger.error(f" Error adding content_hash column: {e}")
+        return False
+
+def add_pr_labels_lower():
+    """
+    Add labels_lower column to pull_requests table
+    Holds the label names pre-lowercased at sync time so the metric
+    aggregators don't re-lowercase every label list on each pass
+    """
+    try:
+        logger.info("Checking for labels_lower column in pull_requests...")
+
+        if not column_exists('pull_requests', 'labels_lower'):
+            logger.info("Adding labels_lower column to pull_requests...")
+            with engine.connect() as connection:
+                connection.execute(text(
+                    "ALTER TABLE pull_requests ADD COLUMN labels_lower JSON"
+                ))
+                connection.commit()
+                logger.info(" Added labels_lower column")
+        else:
+            logger.info(" labels_lower column already exists")
+
+        return True
+
+    except Exception as e:
+        logger.error(f" Error adding labels_lower column: {e}")
+        return False
+
+def add_pr_state_bucket():
+    """
+    Add pr_state_bucket column to pull_requests table
+    Holds the label-derived state bucket classified at sync time so
+    /api/pr-states aggregates with a GROUP BY instead of loading rows.
+    Existing rows are backfilled in SQL using the same label precedence.
+    """
+    try:
+        logger.info("Checking for pr_state_bucket column in pull_requests...")
+
+        if not column_exists('pull_requests', 'pr_state_bucket'):
+            logger.info("Adding pr_state_bucket column to pull_requests...")
+            with engine.connect() as connection:
+                connection.execute(text(
+                    "ALTER TABLE pull_requests ADD COLUMN pr_state_bucket VARCHAR"
+                ))
+                # Backfill from the labels column (lowercased as JSON text)
+                # using the same precedence the sync applies at ingest
+                connection.execute(text("""
+                    UPDATE pull_requests SET pr_state_bucket = CASE
+                        WHEN merged THEN 'merged'
+                        WHEN lower(labels::text)::jsonb ? 'ready to merge' THEN 'ready_to_merge'
+                        WHEN lower(labels::text)::jsonb ? 'expert approved' THEN 'expert_approved'
+                        WHEN lower(labels::text)::jsonb ? 'calibrator review pending' THEN 'calibrator_review_pending'
+                        WHEN lower(labels::text)::jsonb ? 'expert review pending' THEN 'expert_review_pending'
+                        ELSE 'other'
+                    END
+                    WHERE pr_state_bucket IS NULL
+                """))
+                connection.execute(text(
+                    "CREATE INDEX IF NOT EXISTS idx_pr_state_bucket_domain "
+                    "ON pull_requests (pr_state_bucket, domain)"
+                ))
+                connection.commit()
+                logger.info(" Added pr_state_bucket column (backfilled + indexed)")
+        else:
+            logger.info(" pr_state_bucket column already exists")
+
+        return True
+
+    except Exception as e:
+        logger.error(f" Error adding pr_state_bucket column: {e}")
+        return False
+
 def create_task_embedding_table():
     """
     Create task_embeddings table for caching instruction embeddings
@@ -933,7 +1028,16 @@ def run_migrations():
     
     # Add task analysis columns for cosine similarity feature
     add_task_analysis_columns()
-    
+
+    # Add content_hash to interface_metrics table
+    add_interface_metrics_content_hash()
+
+    # Add labels_lower to pull_requests table
+    add_pr_labels_lower()
+
+    # Add pr_state_bucket to pull_requests table
+    add_pr_state_bucket()
+
     # Create task_embeddings and task_similarities tables
     create_task_embedding_table()
     create_task_similarity_table()
@@ -1,4 +1,11 @@
+import hashlib
 import re
+import sys
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional, Tuple
 from github import Github, GithubException
@@ -11,101 +18,280 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _chunked(iterable, size):
+    """Yield lists of up to `size` items from an iterable (e.g. a paginated GitHub result)."""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _pct(part, whole):
+    """Percentage of `part` in `whole`, rounded to 2 places (0.0 when whole is 0)."""
+    return round(part / whole * 100, 2) if whole else 0.0
+
+@contextmanager
+def _no_expire_on_commit(db):
+    """Keep loaded ORM objects live across batched commits.
+
+    By default every commit expires the session's objects, so the next
+    attribute access in the loop re-SELECTs them; the aggregators don't
+    need that freshness between their own batch commits.
+    """
+    previous = db.expire_on_commit
+    db.expire_on_commit = False
+    try:
+        yield
+    finally:
+        db.expire_on_commit = previous
+
+def _gh_datetime(value):
+    """Parse a GraphQL ISO-8601 timestamp (or None) into a datetime."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+# Reviews, changed files and latest-commit check runs for one PR in a
+# single round-trip (one rate-limit point instead of four REST calls)
+_PR_GRAPH_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      reviews(first: 100) {
+        nodes { databaseId author { login } state submittedAt body }
+      }
+      files(first: 100) { nodes { path } }
+      commits(last: 1) {
+        nodes {
+          commit {
+            checkSuites(first: 10) {
+              nodes {
+                checkRuns(first: 50) {
+                  nodes { databaseId name status conclusion startedAt completedAt }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Pattern to match PRs: {trainer_name}-{domain}-{interface_num}-{complexity_level}-{timestamp}
+# Example: haseeb-fund_finance-3-expert-1760428727
+# NOTE: Made trainer name non-greedy to avoid consuming domain parts
+# The looser legacy alternative (optional interface/complexity) is fused
+# in so a non-matching title costs one engine invocation, not two; which
+# alternative fired is visible from the named groups. re.ASCII keeps the
+# \w checks out of Unicode property lookups.
+TITLE_PATTERN = re.compile(
+    r'^(?:'
+    r'(?P<trainer>[a-zA-Z0-9\._-]+?)-(?P<domain>[\w_-]+)-(?P<num>\d+)-(?P<cpx>expert|hard|medium)-(?P<ts>\d{10})'
+    r'|'
+    r'(?P<alt_trainer>[a-zA-Z0-9\._-]+?)-(?P<alt_domain>[\w_-]+)-(?P<alt_num>\d+)?-?(?P<alt_cpx>expert|hard|medium)?-?(?P<alt_ts>\d{10,})'
+    r')$',
+    re.ASCII
+)
+# Pattern for task files (same format, but may have .json extension)
+TASK_FILE_PATTERN = re.compile(r'^([a-zA-Z0-9\._-]+?)-([\w_-]+)-(\d+)-(expert|hard|medium)-(\d{10})(?:\.json)?$')
+# Pattern to extract week and pod from file paths
+# Supports both formats:
+# 1. Old: week_12/bandreddy_pod/task_name/...
+# 2. New: week_13_hr_talent/mansoor_pod/task_name/...
+WEEK_POD_PATTERN = re.compile(r'^week_(\d+)(?:_[\w_-]+)?/([^/]+)/')
+
+# Label statuses in priority order - the first label present wins, which
+# mirrors the old if/elif cascades. Each entry maps the label text to the
+# counter it increments. The label strings are interned (multi-word
+# literals aren't auto-interned by CPython) so set lookups can take the
+# pointer-equality fast path when the probed string is interned too.
+_INTERFACE_STATUS_PRIORITY = tuple((sys.intern(label), counter) for label, counter in (
+    ('discarded', 'discarded'),
+    ('ready to merge', 'ready_to_merge'),
+    ('pod lead approved', 'pod_lead_approved'),
+    ('expert approved', 'expert_approved'),
+    ('good task', 'good_task'),
+    ('expert review pending', 'expert_review_pending'),
+    ('pending review', 'pending_review'),
+    ('resubmitted', 'resubmitted')
+))
+_DOMAIN_STATUS_PRIORITY = tuple((sys.intern(label), counter) for label, counter in (
+    ('ready to merge', 'ready_to_merge'),
+    ('expert approved', 'expert_approved'),
+    ('calibrator review pending', 'calibrator_review_pending'),
+    ('expert review pending', 'expert_review_pending')
+))
+# Precedence for the persisted pr_state_bucket column behind /api/pr-states
+_PR_STATE_BUCKET_PRIORITY = tuple((sys.intern(label), bucket) for label, bucket in (
+    ('ready to merge', 'ready_to_merge'),
+    ('expert approved', 'expert_approved'),
+    ('calibrator review pending', 'calibrator_review_pending'),
+    ('expert review pending', 'expert_review_pending')
+))
+
+# Domain fragments that suggest a compound domain name got split on
+# a hyphen (checked on every malformed title/filename)
+_SUSPICIOUS_DOMAINS = frozenset({
+    'expert', 'experts', 'hard', 'medium', 'management',
+    'payroll', 'finance', 'wiki', 'home', 'incident'
+})
+
+# Shared transport, reused across service instances: the PyGithub client and
+# the GraphQL session both hold keepalive connection pools, so rebuilding them
+# on every sync trigger re-pays TCP+TLS setup for nothing. The service itself
+# stays per-sync (its caches and domain snapshot are meant to reset per run).
+_github_client = None
+_graphql_session = requests.Session()
+
+
+def _get_github_client() -> Github:
+    global _github_client
+    if _github_client is None:
+        # Set per_page=100 to fetch 100 items per page (max allowed by GitHub API)
+        _github_client = Github(settings.github_token, per_page=100)
+    return _github_client
+
+
 class GitHubService:
     def __init__(self):
-        # Set per_page=100 to fetch 100 items per page (max allowed by GitHub API)
-        self.github = Github(settings.github_token, per_page=100)
+        self.github = _get_github_client()
         self.repo = self.github.get_repo(settings.github_repo)
-        
-        # Known valid domains (for fixing malformed PR titles)
-        self.valid_domains = set(settings.allowed_domains)
-        
-        # Pattern to match PRs: {trainer_name}-{domain}-{interface_num}-{complexity_level}-{timestamp}
-        # Example: haseeb-fund_finance-3-expert-1760428727
-        # NOTE: Made trainer name non-greedy to avoid consuming domain parts
-        self.pr_pattern = re.compile(r'^([a-zA-Z0-9\._-]+?)-([\w_-]+)-(\d+)-(expert|hard|medium)-(\d{10})$')
-        # Pattern for task files (same format, but may have .json extension)
-        self.task_file_pattern = re.compile(r'^([a-zA-Z0-9\._-]+?)-([\w_-]+)-(\d+)-(expert|hard|medium)-(\d{10})(?:\.json)?$')
-        # Pattern to extract week and pod from file paths
-        # Supports both formats:
-        # 1. Old: week_12/bandreddy_pod/task_name/...
-        # 2. New: week_13_hr_talent/mansoor_pod/task_name/...
-        self.week_pod_pattern = re.compile(r'^week_(\d+)(?:_[\w_-]+)?/([^/]+)/')
-        
+
+        # Known valid domains (for fixing malformed PR titles) - snapshotted
+        # per service instance because the settings list can be refreshed
+        # from GitHub at runtime
+        self.valid_domains = frozenset(settings.allowed_domains)
+        # (prefix, suffix) -> full domain, for rejoining compound domain
+        # names that got split on a hyphen, without rebuilding the string
+        # on every malformed title/filename
+        self._malformed_fix = {
+            (p, s): full
+            for full in self.valid_domains if '_' in full
+            for p, s in [full.split('_', 1)]
+        }
+
+        # Entities touched by the current sync pass - lets incremental syncs
+        # rebuild only the affected metric rows instead of every table
+        self._reset_dirty()
+
+        # (entity_type, natural_key) -> primary key, shared across the
+        # sync's sessions. Combined with each Session's identity map this
+        # turns repeat get_or_create_* lookups into dict hits instead of
+        # SELECTs. A stale id (e.g. after a savepoint rollback) just falls
+        # through to the natural-key query. Scoped to the service instance,
+        # which is created fresh per sync run.
+        self._id_cache: Dict[Tuple, int] = {}
+        # (user_id, domain_id) pairs already known to be assigned
+        self._assignment_cache: set = set()
+        # Memoized task-filename parser. Bound per instance (not on the
+        # class) so the cache respects this run's domain list and doesn't
+        # pin old service instances alive.
+        self._parse_task_name = lru_cache(maxsize=4096)(self._parse_task_name_uncached)
+        # github_id -> primary key for every stored PR, prefetched by the
+        # sync drivers so the per-PR existence check is a dict hit
+        self._existing_pr_map: Dict[int, int] = {}
+        self._pr_map_loaded = False
+
+    def _load_existing_pr_map(self, db: Session):
+        """Prefetch all stored PR (github_id -> id) pairs in one query.
+
+        Replaces the per-PR existence SELECT in sync_pull_request with a
+        dict lookup; inserts keep the map current as the sync proceeds.
+        """
+        self._existing_pr_map = dict(db.query(PullRequest.github_id, PullRequest.id).all())
+        self._pr_map_loaded = True
+        logger.debug(f"Prefetched {len(self._existing_pr_map)} existing PR ids")
+
+    def _reset_dirty(self):
+        """Clear the dirty sets tracked during a sync pass."""
+        self._dirty = {
+            'developers': set(),
+            'reviewers': set(),
+            'domains': set(),
+            'interfaces': set()
+        }
+
     def parse_pr_title(self, title: str) -> Optional[Dict]:
         """Parse PR title to extract trainer, domain, interface number, complexity, and timestamp.
         
         Handles both correct format (hr_experts) and malformed format (hr-experts).
         """
-        match = self.pr_pattern.match(title)
-        if match:
-            trainer_name = match.group(1)
-            domain = match.group(2)
-            interface_num = int(match.group(3))
-            complexity = match.group(4)
-            timestamp = match.group(5)
-            
-            # Fix malformed domains: convert hyphens to underscores and check against valid domains
-            domain_normalized = domain.replace('-', '_')
-            
-            # If the normalized domain is in our valid list, use it
-            if domain_normalized in self.valid_domains:
-                domain = domain_normalized
-            # If the original domain is too short or suspicious, try to fix it
-            elif domain in ['expert', 'experts', 'hard', 'medium', 'management', 'payroll', 'finance', 'wiki', 'home', 'incident']:
-                # This might be part of a compound domain name that got split
-                # Try to reconstruct by looking at the trainer name ending
-                parts = trainer_name.split('-')
-                if len(parts) > 1:
-                    # Last part of trainer might actually be first part of domain
-                    potential_prefix = parts[-1]
-                    potential_domain = f"{potential_prefix}_{domain}"
-                    if potential_domain in self.valid_domains:
-                        # Fix the split
-                        trainer_name = '-'.join(parts[:-1])
-                        domain = potential_domain
-            
-            return {
-                'trainer_name': trainer_name,
-                'domain': domain,
-                'interface_num': interface_num,
-                'complexity': complexity,
-                'timestamp': timestamp
-            }
-        
-        # Try alternative pattern for backward compatibility
-        alt_pattern = re.compile(r'^([a-zA-Z0-9\._-]+?)-([\w_-]+)-(\d+)?-?(expert|hard|medium)?-?(\d{10,})$')
-        match = alt_pattern.match(title)
-        if match:
+        match = TITLE_PATTERN.match(title)
+        if not match:
+            return None
+
+        if match.group('trainer') is None:
+            # The legacy backward-compatibility alternative fired
             return {
-                'trainer_name': match.group(1),
-                'domain': match.group(2),
-                'interface_num': int(match.group(3)) if match.group(3) else 0,
-                'complexity': match.group(4) if match.group(4) else 'unknown',
-                'timestamp': match.group(5)
+                'trainer_name': match.group('alt_trainer'),
+                'domain': match.group('alt_domain'),
+                'interface_num': int(match.group('alt_num')) if match.group('alt_num') else 0,
+                'complexity': match.group('alt_cpx') if match.group('alt_cpx') else 'unknown',
+                'timestamp': match.group('alt_ts')
             }
-        
-        return None
+
+        trainer_name = match.group('trainer')
+        domain = match.group('domain')
+        interface_num = int(match.group('num'))
+        complexity = match.group('cpx')
+        timestamp = match.group('ts')
+
+        # Fix malformed domains: convert hyphens to underscores and check against valid domains
+        domain_normalized = domain.replace('-', '_')
+
+        # If the normalized domain is in our valid list, use it
+        if domain_normalized in self.valid_domains:
+            domain = domain_normalized
+        # If the original domain is too short or suspicious, try to fix it
+        elif domain in _SUSPICIOUS_DOMAINS:
+            # This might be part of a compound domain name that got split
+            # Try to reconstruct by looking at the trainer name ending
+            prefix, sep, last = trainer_name.rpartition('-')
+            if sep:
+                # Last part of trainer might actually be first part of domain
+                fixed = self._malformed_fix.get((last, domain))
+                if fixed:
+                    # Fix the split
+                    trainer_name = prefix
+                    domain = fixed
+
+        return {
+            'trainer_name': trainer_name,
+            'domain': domain,
+            'interface_num': interface_num,
+            'complexity': complexity,
+            'timestamp': timestamp
+        }
     
     def should_process_pr(self, pr) -> bool:
         """Check if PR matches our criteria (has proper format)."""
-        # Check if title matches our pattern
-        if not self.parse_pr_title(pr.title):
+        # Check if title matches our pattern; stash the parse on the PR
+        # object so sync_pull_request doesn't run the regex a second time
+        parsed = self.parse_pr_title(pr.title)
+        pr._parsed_title = parsed
+        if not parsed:
             return False
-        
+
         # Labels are optional but recommended for accurate metrics
         # We process PRs regardless of labels
         return True
     
-    def calculate_rework_count(self, pr, db: Session) -> int:
+    def calculate_rework_count(self, pr, db: Session, review_rows: Optional[List[Dict]] = None) -> int:
         """Calculate rework count based on review feedback only."""
+        # Count reviews requesting changes (pre-fetched rows when available)
+        if review_rows is not None:
+            return sum(1 for review in review_rows if review['state'] == 'CHANGES_REQUESTED')
+
         rework_count = 0
-        
-        # Count reviews requesting changes
         for review in pr.get_reviews():
             if review.state == 'CHANGES_REQUESTED':
                 rework_count += 1
-        
+
         return rework_count
     
     def calculate_failed_checks_count(self, pr) -> int:
@@ -130,164 +316,233 @@ class GitHubService:
     # Entity Creation Helpers (Migration-Aware)
     # ===========================
     
+    def _get_cached(self, model, cache_key, db: Session):
+        """Fetch a cached entity by primary key, or None on a cache miss.
+
+        Session.get hits the session's identity map first, so repeat
+        lookups within one session cost no SQL at all.
+        """
+        cached_id = self._id_cache.get(cache_key)
+        if cached_id is None:
+            return None
+        return db.get(model, cached_id)
+
+    def _upsert_id(self, model, values: Dict, conflict_cols: Optional[List[str]] = None, db: Session = None) -> Optional[int]:
+        """Insert-or-noop on `model`'s unique constraint, returning the new id.
+
+        One atomic round-trip instead of SELECT -> INSERT -> catch
+        IntegrityError -> rollback -> re-SELECT; the rollback in that old
+        pattern discarded the whole in-flight transaction on every race.
+        Returns None when the row already existed (conflict fired).
+        """
+        stmt = pg_insert(model).values(**values)
+        if conflict_cols:
+            stmt = stmt.on_conflict_do_nothing(index_elements=conflict_cols)
+        else:
+            stmt = stmt.on_conflict_do_nothing()
+        return db.execute(stmt.returning(model.id)).scalar()
+
     def get_or_create_user(self, github_username: str, role: str, db: Session) -> User:
         """Get or create a user by GitHub username."""
-        from sqlalchemy.exc import IntegrityError
-        
-        user = db.query(User).filter_by(github_username=github_username).first()
-        if not user:
-            try:
-                user = User(
-                    github_username=github_username,
-                    role=role,
-                    email=f"{github_username}@github.local"  # Placeholder email
-                )
-                db.add(user)
-                db.flush()
-                logger.info(f"Created new user: {github_username} (role: {role})")
-            except IntegrityError:
-                # User was created by another process/transaction, rollback and fetch
-                db.rollback()
-                user = db.query(User).filter_by(github_username=github_username).first()
-                if not user:
-                    # Try alternative query by email (edge case)
-                    user = db.query(User).filter_by(email=f"{github_username}@github.local").first()
+        user = self._get_cached(User, ('user', github_username), db)
+        if user:
+            return user
+
+        # No index_elements: the placeholder email is unique too, so let
+        # either constraint turn the insert into a noop
+        new_id = self._upsert_id(User, {
+            'github_username': github_username,
+            'role': role,
+            'email': f"{github_username}@github.local"  # Placeholder email
+        }, db=db)
+        if new_id is not None:
+            logger.info(f"Created new user: {github_username} (role: {role})")
+            user = db.get(User, new_id)
+        else:
+            user = db.query(User).filter_by(github_username=github_username).first()
+            if not user:
+                # Try alternative query by email (edge case)
+                user = db.query(User).filter_by(email=f"{github_username}@github.local").first()
+        if user:
+            self._id_cache[('user', github_username)] = user.id
         return user
-    
+
     def get_or_create_domain(self, domain_name: str, db: Session) -> Domain:
         """Get or create a domain by name."""
-        from sqlalchemy.exc import IntegrityError
-        
-        domain = db.query(Domain).filter_by(domain_name=domain_name).first()
-        if not domain:
-            try:
-                domain = Domain(domain_name=domain_name)
-                db.add(domain)
-                db.flush()
-                logger.info(f"Created new domain: {domain_name}")
-            except IntegrityError:
-                db.rollback()
-                domain = db.query(Domain).filter_by(domain_name=domain_name).first()
+        domain = self._get_cached(Domain, ('domain', domain_name), db)
+        if domain:
+            return domain
+
+        new_id = self._upsert_id(Domain, {'domain_name': domain_name}, ['domain_name'], db)
+        if new_id is not None:
+            logger.info(f"Created new domain: {domain_name}")
+            domain = db.get(Domain, new_id)
+        else:
+            domain = db.query(Domain).filter_by(domain_name=domain_name).first()
+        if domain:
+            self._id_cache[('domain', domain_name)] = domain.id
         return domain
-    
+
     def get_or_create_interface(self, domain: Domain, interface_num: int, db: Session) -> Interface:
         """Get or create an interface for a domain."""
-        from sqlalchemy.exc import IntegrityError
-        
-        interface = db.query(Interface).filter_by(
-            domain_id=domain.id,
-            interface_num=interface_num
-        ).first()
-        if not interface:
-            try:
-                interface = Interface(
-                    domain_id=domain.id,
-                    interface_num=interface_num
-                )
-                db.add(interface)
-                db.flush()
-                logger.info(f"Created new interface: {domain.domain_name} - Interface {interface_num}")
-            except IntegrityError:
-                db.rollback()
-                interface = db.query(Interface).filter_by(
-                    domain_id=domain.id,
-                    interface_num=interface_num
-                ).first()
+        interface = self._get_cached(Interface, ('interface', domain.id, interface_num), db)
+        if interface:
+            return interface
+
+        new_id = self._upsert_id(Interface, {
+            'domain_id': domain.id,
+            'interface_num': interface_num
+        }, ['domain_id', 'interface_num'], db)
+        if new_id is not None:
+            logger.info(f"Created new interface: {domain.domain_name} - Interface {interface_num}")
+            interface = db.get(Interface, new_id)
+        else:
+            interface = db.query(Interface).filter_by(
+                domain_id=domain.id,
+                interface_num=interface_num
+            ).first()
+        if interface:
+            self._id_cache[('interface', domain.id, interface_num)] = interface.id
         return interface
-    
+
     def get_or_create_week(self, week_num: int, db: Session) -> Week:
         """Get or create a week by number."""
-        from sqlalchemy.exc import IntegrityError
-        
-        week = db.query(Week).filter_by(week_num=week_num).first()
-        if not week:
-            try:
-                week = Week(
-                    week_name=f"week_{week_num}",
-                    week_num=week_num
-                )
-                db.add(week)
-                db.flush()
-                logger.info(f"Created new week: week_{week_num}")
-            except IntegrityError:
-                db.rollback()
-                week = db.query(Week).filter_by(week_num=week_num).first()
+        week = self._get_cached(Week, ('week', week_num), db)
+        if week:
+            return week
+
+        new_id = self._upsert_id(Week, {
+            'week_name': f"week_{week_num}",
+            'week_num': week_num
+        }, ['week_name'], db)
+        if new_id is not None:
+            logger.info(f"Created new week: week_{week_num}")
+            week = db.get(Week, new_id)
+        else:
+            week = db.query(Week).filter_by(week_num=week_num).first()
+        if week:
+            self._id_cache[('week', week_num)] = week.id
         return week
-    
+
     def get_or_create_pod(self, pod_name: str, db: Session) -> Pod:
         """Get or create a pod by name."""
-        from sqlalchemy.exc import IntegrityError
-        
-        pod = db.query(Pod).filter_by(name=pod_name).first()
-        if not pod:
-            try:
-                pod = Pod(name=pod_name)
-                db.add(pod)
-                db.flush()
-                logger.info(f"Created new pod: {pod_name}")
-            except IntegrityError:
-                db.rollback()
-                pod = db.query(Pod).filter_by(name=pod_name).first()
+        pod = self._get_cached(Pod, ('pod', pod_name), db)
+        if pod:
+            return pod
+
+        new_id = self._upsert_id(Pod, {'name': pod_name}, ['name'], db)
+        if new_id is not None:
+            logger.info(f"Created new pod: {pod_name}")
+            pod = db.get(Pod, new_id)
+        else:
+            pod = db.query(Pod).filter_by(name=pod_name).first()
+        if pod:
+            self._id_cache[('pod', pod_name)] = pod.id
         return pod
-    
+
     def assign_user_to_domain(self, user: User, domain: Domain, db: Session):
         """Create user-domain assignment if it doesn't exist."""
         from sqlalchemy.exc import IntegrityError
-        
+
         # Validate inputs
         if not user or not domain:
             logger.warning(f"Cannot assign user/domain: user={user}, domain={domain}")
             return
-        
-        # Refresh user and domain to ensure they're in the current session
+
+        # Already confirmed/created during this sync run - nothing to do
+        if (user.id, domain.id) in self._assignment_cache:
+            return
+
         try:
-            db.refresh(user)
-            db.refresh(domain)
-        except Exception as e:
-            logger.warning(f"Could not refresh user/domain objects: {str(e)}")
-            # Try to re-fetch from DB
-            user = db.query(User).filter_by(id=user.id).first()
-            domain = db.query(Domain).filter_by(id=domain.id).first()
-            if not user or not domain:
-                logger.error(f"Could not re-fetch user/domain after refresh failure")
-                return
-        
-        existing = db.query(UserDomainAssignment).filter_by(
-            user_id=user.id,
-            domain_id=domain.id
-        ).first()
-        
-        if not existing:
-            try:
-                assignment = UserDomainAssignment(
-                    user_id=user.id,
-                    domain_id=domain.id
-                )
-                db.add(assignment)
-                db.flush()
-                logger.info(f"Assigned user {user.github_username} to domain {domain.domain_name}")
-            except IntegrityError as e:
-                # Assignment might already exist or foreign key constraint failed
-                db.rollback()
-                logger.warning(f"Could not assign user {user.github_username} to domain {domain.domain_name}: {str(e)}")
-                # Try to re-fetch the assignment (might have been created by another transaction)
-                existing = db.query(UserDomainAssignment).filter_by(
-                    user_id=user.id,
-                    domain_id=domain.id
-                ).first()
+            new_id = self._upsert_id(UserDomainAssignment, {
+                'user_id': user.id,
+                'domain_id': domain.id
+            }, ['user_id', 'domain_id'], db)
+        except IntegrityError as e:
+            # Foreign key constraint failed (user/domain row disappeared)
+            db.rollback()
+            logger.warning(f"Could not assign user {user.github_username} to domain {domain.domain_name}: {str(e)}")
+            return
+
+        if new_id is not None:
+            logger.info(f"Assigned user {user.github_username} to domain {domain.domain_name}")
+        self._assignment_cache.add((user.id, domain.id))
     
-    def parse_week_pod_from_pr_files(self, pr) -> Optional[Tuple[int, str]]:
+    def _fetch_pr_graph(self, pr_number: int) -> Optional[Dict]:
+        """Fetch a PR's reviews, changed files and check runs in one GraphQL query.
+
+        Returns {'reviews': [...], 'files': [...], 'check_runs': [...]} with
+        values normalized to the shapes the sync helpers consume, or None on
+        any failure so callers fall back to per-resource REST calls.
+        """
+        try:
+            owner, name = settings.github_repo.split('/', 1)
+            response = _graphql_session.post(
+                "https://api.github.com/graphql",
+                json={
+                    'query': _PR_GRAPH_QUERY,
+                    'variables': {'owner': owner, 'name': name, 'number': pr_number}
+                },
+                headers={'Authorization': f"Bearer {settings.github_token}"},
+                timeout=30
+            )
+            response.raise_for_status()
+            payload = response.json()
+            if payload.get('errors'):
+                logger.debug(f"GraphQL errors for PR #{pr_number}: {payload['errors']}")
+                return None
+            node = payload['data']['repository']['pullRequest']
+            if node is None:
+                return None
+
+            reviews = [
+                {
+                    'github_id': r['databaseId'],
+                    'login': r['author']['login'] if r.get('author') else None,
+                    'state': r['state'],
+                    'submitted_at': _gh_datetime(r.get('submittedAt')),
+                    'body': r.get('body')
+                }
+                for r in node['reviews']['nodes']
+            ]
+            files = [f['path'] for f in node['files']['nodes']]
+            # GraphQL reports status/conclusion in uppercase; the REST API
+            # (and everything stored so far) uses lowercase
+            check_runs = []
+            for commit_node in node['commits']['nodes']:
+                for suite in commit_node['commit']['checkSuites']['nodes']:
+                    for run in suite['checkRuns']['nodes']:
+                        check_runs.append({
+                            'github_id': run['databaseId'],
+                            'name': run['name'],
+                            'status': run['status'].lower() if run.get('status') else None,
+                            'conclusion': run['conclusion'].lower() if run.get('conclusion') else None,
+                            'started_at': _gh_datetime(run.get('startedAt')),
+                            'completed_at': _gh_datetime(run.get('completedAt'))
+                        })
+            return {'reviews': reviews, 'files': files, 'check_runs': check_runs}
+        except Exception as e:
+            logger.debug(f"GraphQL fetch failed for PR #{pr_number}: {str(e)}")
+            return None
+
+    def parse_week_pod_from_pr_files(self, pr, filenames: Optional[List[str]] = None) -> Optional[Tuple[int, str]]:
         """
         Parse week number and pod name from PR file changes.
         Supports both formats:
         1. Old: week_12/bandreddy_pod/task_folder/...
         2. New: week_13_hr_talent/mansoor_pod/task_folder/...
+        `filenames` carries pre-fetched paths (from the GraphQL batch);
+        when absent the files are fetched over REST.
         Returns: (week_num, pod_name) or None if not found
         """
         try:
-            files = pr.get_files()
-            for file in files:
-                match = self.week_pod_pattern.match(file.filename)
+            if filenames is None:
+                # Lazy REST pagination (100 files/page via the client-wide
+                # per_page) - returning on the first match below means only
+                # the first page is ever fetched for typical PRs
+                filenames = (file.filename for file in pr.get_files())
+            for filename in filenames:
+                match = WEEK_POD_PATTERN.match(filename)
                 if match:
                     week_num = int(match.group(1))
                     pod_name = match.group(2)
@@ -607,13 +862,20 @@ class GitHubService:
             if not self.should_process_pr(pr):
                 return None
             
-            # Parse PR title
-            parsed = self.parse_pr_title(pr.title)
+            # Parse PR title (should_process_pr already parsed it above)
+            parsed = getattr(pr, '_parsed_title', None) or self.parse_pr_title(pr.title)
             if not parsed:
                 return None
             
-            # Check if PR already exists
-            db_pr = db.query(PullRequest).filter_by(github_id=pr.id).first()
+            # Check if PR already exists - via the prefetched id map when a
+            # sync driver loaded it (dict hit + primary-key get), otherwise
+            # the natural-key lookup for single-PR callers
+            db_pr = None
+            pk = self._existing_pr_map.get(pr.id)
+            if pk is not None:
+                db_pr = db.get(PullRequest, pk)
+            elif not self._pr_map_loaded:
+                db_pr = db.query(PullRequest).filter_by(github_id=pr.id).first()
             is_new_pr = False
             if not db_pr:
                 db_pr = PullRequest(github_id=pr.id)
@@ -630,6 +892,21 @@ class GitHubService:
                 db_pr.last_synced = datetime.now(timezone.utc)
                 return db_pr
             
+            # Stand-in for ETag conditional requests: PyGithub doesn't
+            # surface ETags for these sub-resources, but an unchanged
+            # PR-level updated_at means everything we'd re-download
+            # matches what we already stored - just refresh the
+            # bookkeeping timestamp and return.
+            last_synced = db_pr.last_synced if not is_new_pr else None
+            if last_synced is not None and last_synced.tzinfo is None:
+                last_synced = last_synced.replace(tzinfo=timezone.utc)
+            if (last_synced is not None
+                    and pr.updated_at is not None
+                    and pr.updated_at <= last_synced):
+                logger.debug(f"PR #{pr.number}: Unchanged since last sync, skipping")
+                db_pr.last_synced = datetime.now(timezone.utc)
+                return db_pr
+
             # Update PR fields
             db_pr.number = pr.number
             db_pr.title = pr.title
@@ -651,12 +928,15 @@ class GitHubService:
             
             db_pr.author_login = pr.user.login
             
-            # Try to get author email from GitHub (might be None if private)
+            # Try to get author email (might be None if private). Only read
+            # it when it's already in the listing payload - the attribute
+            # access otherwise makes PyGithub issue a full GET /users/{login}
             try:
-                author_email = pr.user.email
-                if author_email:
-                    db_pr.author_email = author_email
-                    logger.info(f"Fetched email for {pr.user.login}: {author_email}")
+                if 'email' in pr.user._rawData:
+                    author_email = pr.user.email
+                    if author_email:
+                        db_pr.author_email = author_email
+                        logger.info(f"Fetched email for {pr.user.login}: {author_email}")
             except Exception as e:
                 logger.debug(f"Could not fetch email for {pr.user.login}: {e}")
             
@@ -665,8 +945,27 @@ class GitHubService:
             db_pr.closed_at = pr.closed_at
             db_pr.merged_at = pr.merged_at
             
-            # Update labels
-            db_pr.labels = [label.name for label in pr.labels]
+            # Update labels - names are already in the paginated payload, so
+            # read them from the raw data instead of letting PyGithub expand
+            # each label into a full object
+            raw = pr._rawData
+            if 'labels' in raw:
+                db_pr.labels = [label['name'] for label in raw['labels']]
+            else:
+                db_pr.labels = [label.name for label in pr.labels]
+            # Pre-lowercase once at ingest so the aggregators don't redo it
+            # for every metrics pass; drop the instance-level memo since the
+            # labels may just have changed
+            db_pr.labels_lower = [name.lower() for name in db_pr.labels]
+            db_pr.__dict__.pop('_labels_lower_set', None)
+            # Classify the label-derived state bucket once at ingest so the
+            # /api/pr-states endpoint is a plain GROUP BY over this column
+            if db_pr.merged:
+                db_pr.pr_state_bucket = 'merged'
+            else:
+                db_pr.pr_state_bucket = next(
+                    (bucket for label, bucket in _PR_STATE_BUCKET_PRIORITY
+                     if label in db_pr.labels_lower), 'other')
             
             # Fetch and store requested reviewers (only GitHub usernames)
             try:
@@ -682,12 +981,22 @@ class GitHubService:
             db_pr.review_count = pr.review_comments
             db_pr.comment_count = pr.comments
             
+            # One GraphQL round-trip covers the changed files, reviews and
+            # check runs consumed below; on failure (None) each helper
+            # falls back to its own REST fetch
+            graph = self._fetch_pr_graph(pr.number)
+
             # Parse task execution results from bot comment
             self.parse_task_execution_results(pr, db_pr)
-            
-            # Calculate rework (changes requested reviews only)
-            db_pr.rework_count = self.calculate_rework_count(pr, db)
-            
+
+            # Rework (changes-requested reviews) is tallied inside
+            # sync_reviews from the same review fetch; only compute it
+            # separately when the nested sync is skipped below
+            if skip_nested_data:
+                db_pr.rework_count = self.calculate_rework_count(
+                    pr, db, review_rows=graph['reviews'] if graph else None
+                )
+
             # Calculate failed automated checks (separate from rework)
             db_pr.check_failures = self.calculate_failed_checks_count(pr)
             
@@ -726,7 +1035,9 @@ class GitHubService:
                 # Fetch files when:
                 # 1. Not skipping nested data (full sync needed)
                 # 2. AND (PR doesn't have week_id OR doesn't have pod_id)
-                week_pod_info = self.parse_week_pod_from_pr_files(pr)
+                week_pod_info = self.parse_week_pod_from_pr_files(
+                    pr, filenames=graph['files'] if graph else None
+                )
                 if week_pod_info:
                     week_num, pod_name = week_pod_info
                     week = self.get_or_create_week(week_num, db)
@@ -782,13 +1093,17 @@ class GitHubService:
                     db.flush()
                 else:
                     raise
-            
+
+            # Keep the prefetched id map current for the rest of the run
+            if is_new_pr and db_pr.id is not None:
+                self._existing_pr_map[pr.id] = db_pr.id
+
             # Now sync reviews and check runs (they need db_pr.id to be set)
             # Optimization: Skip if we're doing a quick update (skip_nested_data=True)
             if not skip_nested_data:
-                self.sync_reviews(pr, db_pr, db)
-                self.sync_check_runs(pr, db_pr, db)
-                
+                self.sync_reviews(pr, db_pr, db, review_rows=graph['reviews'] if graph else None)
+                self.sync_check_runs(pr, db_pr, db, check_rows=graph['check_runs'] if graph else None)
+
                 # Fetch task.json and result.json for merged PRs
                 if db_pr.merged and db_pr.merged_at:
                     try:
@@ -798,7 +1113,16 @@ class GitHubService:
                         logger.warning(f"PR #{pr.number}: Could not fetch task data: {e}")
             else:
                 logger.debug(f"PR #{pr.number}: Skipping reviews/check runs fetch (nested data skipped)")
-            
+
+            # Record what this PR touched so incremental syncs can rebuild
+            # only the affected metric rows
+            if db_pr.developer_username:
+                self._dirty['developers'].add(db_pr.developer_username)
+            if db_pr.domain:
+                self._dirty['domains'].add(db_pr.domain)
+            if db_pr.interface_num is not None:
+                self._dirty['interfaces'].add(db_pr.interface_num)
+
             return db_pr
             
         except Exception as e:
@@ -845,68 +1169,128 @@ class GitHubService:
             logger.debug(f"No task execution results found for PR {pr.number}: {str(e)}")
             # Not an error - some PRs may not have this comment yet
     
-    def sync_reviews(self, pr, db_pr: PullRequest, db: Session):
-        """Sync reviews for a pull request."""
+    def sync_reviews(self, pr, db_pr: PullRequest, db: Session, review_rows: Optional[List[Dict]] = None):
+        """Sync reviews for a pull request.
+
+        `review_rows` carries pre-fetched review data (from the GraphQL
+        batch); when absent the reviews are fetched over REST.
+        """
         try:
-            for review in pr.get_reviews():
+            if review_rows is None:
+                review_rows = [
+                    {
+                        'github_id': review.id,
+                        'login': review.user.login,
+                        'state': review.state,
+                        'submitted_at': review.submitted_at,
+                        'body': review.body
+                    }
+                    for review in pr.get_reviews()
+                ]
+            # The PR's domain is the same for every review - resolve it once
+            domain = None
+            if db_pr.domain_id:
+                domain = db.query(Domain).filter_by(id=db_pr.domain_id).first()
+
+            rows = []
+            rework_count = 0
+            for review in review_rows:
+                # Tally rework from the same fetch instead of walking the
+                # review pagination a second time in calculate_rework_count
+                if review['state'] == 'CHANGES_REQUESTED':
+                    rework_count += 1
+                if not review['login']:
+                    continue
                 # Create/get reviewer user (default role: pod_lead, can be updated later)
-                reviewer = self.get_or_create_user(review.user.login, 'pod_lead', db)
-                
+                reviewer = self.get_or_create_user(review['login'], 'pod_lead', db)
+                self._dirty['reviewers'].add(review['login'])
+
                 # Assign reviewer to the PR's domain (for access control)
-                if db_pr.domain_id:
-                    domain = db.query(Domain).filter_by(id=db_pr.domain_id).first()
-                    if domain:
-                        self.assign_user_to_domain(reviewer, domain, db)
-                
-                db_review = db.query(Review).filter_by(github_id=review.id).first()
-                if not db_review:
-                    db_review = Review(
-                        github_id=review.id,
-                        pull_request_id=db_pr.id,
-                        reviewer_id=reviewer.id,  # Set foreign key
-                        reviewer_login=review.user.login,
-                        state=review.state,
-                        submitted_at=review.submitted_at,
-                        body=review.body
-                    )
-                    db.add(db_review)
-                else:
-                    db_review.reviewer_id = reviewer.id  # Update foreign key
-                    db_review.state = review.state
-                    db_review.body = review.body
+                if domain:
+                    self.assign_user_to_domain(reviewer, domain, db)
+
+                rows.append({
+                    'github_id': review['github_id'],
+                    'pull_request_id': db_pr.id,
+                    'reviewer_id': reviewer.id,
+                    'reviewer_login': review['login'],
+                    'state': review['state'],
+                    'submitted_at': review['submitted_at'],
+                    'body': review['body']
+                })
+
+            # One upsert for the whole batch instead of a SELECT plus
+            # INSERT-or-UPDATE round-trip per review
+            if rows:
+                stmt = pg_insert(Review).values(rows)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=['github_id'],
+                    set_={
+                        'reviewer_id': stmt.excluded.reviewer_id,
+                        'state': stmt.excluded.state,
+                        'body': stmt.excluded.body
+                    }
+                )
+                db.execute(stmt)
+
+            db_pr.rework_count = rework_count
         except Exception as e:
             logger.error(f"Error syncing reviews for PR {pr.number}: {str(e)}")
     
-    def sync_check_runs(self, pr, db_pr: PullRequest, db: Session):
-        """Sync check runs for a pull request."""
+    def sync_check_runs(self, pr, db_pr: PullRequest, db: Session, check_rows: Optional[List[Dict]] = None):
+        """Sync check runs for a pull request.
+
+        `check_rows` carries pre-fetched check-run data (from the GraphQL
+        batch); when absent the head commit's runs are fetched over REST.
+        """
         try:
-            # Get check runs from the head commit (not from PR directly)
-            commit = self.repo.get_commit(pr.head.sha)
-            check_runs = commit.get_check_runs()
-            
+            if check_rows is None:
+                # Get check runs from the head commit (not from PR directly)
+                commit = self.repo.get_commit(pr.head.sha)
+                check_rows = [
+                    {
+                        'github_id': check.id,
+                        'name': check.name,
+                        'status': check.status,
+                        'conclusion': check.conclusion,
+                        'started_at': check.started_at,
+                        'completed_at': check.completed_at
+                    }
+                    for check in commit.get_check_runs()
+                ]
+
+            # Store all checks in one upsert instead of a SELECT plus
+            # INSERT-or-UPDATE round-trip per run
+            if check_rows:
+                rows = [
+                    {
+                        'github_id': check['github_id'],
+                        'pull_request_id': db_pr.id,
+                        'name': check['name'],
+                        'status': check['status'],
+                        'conclusion': check['conclusion'],
+                        'started_at': check['started_at'],
+                        'completed_at': check['completed_at']
+                    }
+                    for check in check_rows
+                ]
+                stmt = pg_insert(CheckRun).values(rows)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=['github_id'],
+                    set_={
+                        'status': stmt.excluded.status,
+                        'conclusion': stmt.excluded.conclusion,
+                        'completed_at': stmt.excluded.completed_at
+                    }
+                )
+                db.execute(stmt)
+
             # Group check runs by name and keep only the latest run of each
             # This avoids counting reruns multiple times
             latest_checks = {}
-            for check in check_runs:
-                check_name = check.name
-                # Store all checks (for database)
-                db_check = db.query(CheckRun).filter_by(github_id=check.id).first()
-                if not db_check:
-                    db_check = CheckRun(
-                        github_id=check.id,
-                        pull_request_id=db_pr.id,
-                        name=check.name,
-                        status=check.status,
-                        conclusion=check.conclusion,
-                        started_at=check.started_at,
-                        completed_at=check.completed_at
-                    )
-                    db.add(db_check)
-                else:
-                    db_check.status = check.status
-                    db_check.conclusion = check.conclusion
-                    db_check.completed_at = check.completed_at
-                
+            for check in check_rows:
+                check_name = check['name']
+
                 # Track only the latest run of each check name for counting
                 if check_name not in latest_checks:
                     latest_checks[check_name] = check
@@ -914,26 +1298,26 @@ class GitHubService:
                     # Keep the one with the latest started time (GitHub's definition of "latest")
                     # If started times are equal, use GitHub ID (higher ID = later run)
                     existing = latest_checks[check_name]
-                    existing_started = existing.started_at or existing.completed_at
-                    new_started = check.started_at or check.completed_at
-                    
+                    existing_started = existing['started_at'] or existing['completed_at']
+                    new_started = check['started_at'] or check['completed_at']
+
                     if new_started and existing_started:
                         if new_started > existing_started:
                             latest_checks[check_name] = check
-                        elif new_started == existing_started and check.id > existing.id:
+                        elif new_started == existing_started and check['github_id'] > existing['github_id']:
                             latest_checks[check_name] = check
                     elif new_started:  # existing has no time
                         latest_checks[check_name] = check
-            
+
             # Count only the latest run of each check
             check_failures = 0
             check_passes = 0
             for check in latest_checks.values():
-                if check.conclusion == 'failure':
+                if check['conclusion'] == 'failure':
                     check_failures += 1
-                elif check.conclusion == 'success':
+                elif check['conclusion'] == 'success':
                     check_passes += 1
-            
+
             db_pr.check_failures = check_failures
             db_pr.check_passes = check_passes
         except Exception as e:
@@ -948,61 +1332,58 @@ class GitHubService:
         synced_count = 0
         skipped_count = 0
         total_checked = 0
-        
+
         logger.info("Starting FULL HISTORICAL sync - fetching ALL matching PRs...")
-        
+
+        # One query up front instead of an existence SELECT per PR
+        self._load_existing_pr_map(db)
+
         # Sync ALL open PRs
         logger.info("Syncing all OPEN PRs...")
-        pull_requests = self.repo.get_pulls(state='open', sort='created', direction='asc')
-        for pr in pull_requests:
-            total_checked += 1
-            if self.sync_pull_request(pr, db):
-                synced_count += 1
-                if synced_count % 50 == 0:
-                    db.commit()   
-                    logger.info(f"Synced {synced_count} PRs (checked {total_checked}, skipped {skipped_count})...")
-                else:
-                    skipped_count += 1
-        
+        for chunk in _chunked(self.repo.get_pulls(state='open', sort='created', direction='asc'), 50):
+            total_checked += len(chunk)
+            synced, skipped = self._fan_out_sync(chunk)
+            synced_count += synced
+            skipped_count += skipped
+            logger.info(f"Synced {synced_count} PRs (checked {total_checked}, skipped {skipped_count})...")
+
         # Sync ALL closed PRs (including merged)
         logger.info("Syncing all CLOSED PRs...")
-        for pr in self.repo.get_pulls(state='closed', sort='created', direction='asc'):
-            total_checked += 1
-            if self.sync_pull_request(pr, db):
-                synced_count += 1
-                if synced_count % 50 == 0:
-                    db.commit()
-                    logger.info(f"Synced {synced_count} PRs (checked {total_checked}, skipped {skipped_count})...")
-            else:
-                skipped_count += 1
-        
+        for chunk in _chunked(self.repo.get_pulls(state='closed', sort='created', direction='asc'), 50):
+            total_checked += len(chunk)
+            synced, skipped = self._fan_out_sync(chunk)
+            synced_count += synced
+            skipped_count += skipped
+            logger.info(f"Synced {synced_count} PRs (checked {total_checked}, skipped {skipped_count})...")
+
         # Sync ALL merged PRs (double-check to ensure we got everything)
         logger.info("Syncing all MERGED PRs...")
         try:
-            for pr in self.repo.get_pulls(state='all', sort='created', direction='asc'):
-                try:
-                    if not pr.merged:
-                        continue
-                    total_checked += 1
-                    if self.sync_pull_request(pr, db):
-                        synced_count += 1
-                        if synced_count % 50 == 0:
-                            db.commit()
-                            logger.info(f"Synced {synced_count} PRs (checked {total_checked}, skipped {skipped_count})...")
-                    else:
+            for chunk in _chunked(self.repo.get_pulls(state='all', sort='created', direction='asc'), 50):
+                merged_prs = []
+                for pr in chunk:
+                    try:
+                        if pr.merged:
+                            merged_prs.append(pr)
+                    except Exception as pr_error:
+                        # Skip individual PR errors (404, permission issues, etc.)
+                        if '404' in str(pr_error):
+                            logger.debug(f"Skipping PR (404 - deleted or inaccessible)")
+                        else:
+                            logger.warning(f"Error fetching PR: {str(pr_error)}")
                         skipped_count += 1
-                except Exception as pr_error:
-                    # Skip individual PR errors (404, permission issues, etc.)
-                    if '404' in str(pr_error):
-                        logger.debug(f"Skipping PR (404 - deleted or inaccessible)")
-                    else:
-                        logger.warning(f"Error fetching PR: {str(pr_error)}")
-                    skipped_count += 1
+                        continue
+                if not merged_prs:
                     continue
+                total_checked += len(merged_prs)
+                synced, skipped = self._fan_out_sync(merged_prs)
+                synced_count += synced
+                skipped_count += skipped
+                logger.info(f"Synced {synced_count} PRs (checked {total_checked}, skipped {skipped_count})...")
         except Exception as e:
             logger.warning(f"Error in merged PR sync loop: {str(e)}")
             logger.info("Continuing with what we have...")
-        
+
         db.commit()
         logger.info(f"FULL SYNC completed!")
         logger.info(f"  Total PRs checked: {total_checked}")
@@ -1011,17 +1392,14 @@ class GitHubService:
         
         # Update aggregated metrics
         logger.info("Updating aggregated metrics...")
-        self.update_developer_metrics(db)
-        self.update_reviewer_metrics(db)
-        self.update_domain_metrics(db)
-        self.update_interface_metrics(db)
+        self.update_all_metrics()
         logger.info("Metrics updated successfully")
-        
+
         # Update last sync time
         update_last_sync_time(db)
-        
+
         return synced_count
-    
+
     def sync_all_prs(self, db: Session, since_days: int = 60):
         """Sync all PRs from the last N days."""
         # Use timezone-aware datetime for comparison with GitHub API datetimes
@@ -1030,45 +1408,69 @@ class GitHubService:
         skipped_count = 0
         
         logger.info(f"Starting full sync for PRs since {since} ({since_days} days)")
-        
+
+        # One query up front instead of an existence SELECT per PR
+        self._load_existing_pr_map(db)
+
         # Sync open PRs (sorted by created date descending by default)
         logger.info("Syncing open PRs...")
-        for pr in self.repo.get_pulls(state='open', sort='created', direction='desc'):
-            if pr.created_at < since:
-                # Open PRs sorted by created, so break when we hit old ones
+        stop_iteration = False
+        for chunk in _chunked(self.repo.get_pulls(state='open', sort='created', direction='desc'), 50):
+            batch = []
+            for pr in chunk:
+                if pr.created_at < since:
+                    # Open PRs sorted by created, so stop when we hit old ones
+                    stop_iteration = True
+                    break
+                batch.append(pr)
+            if batch:
+                synced, skipped = self._fan_out_sync(batch)
+                synced_count += synced
+                skipped_count += skipped
+                logger.info(f"Synced {synced_count} PRs...")
+            if stop_iteration:
                 break
-            if self.sync_pull_request(pr, db):
-                synced_count += 1
-                if synced_count % 10 == 0:
-                    db.commit()
-                    logger.info(f"Synced {synced_count} PRs...")
-            else:
-                skipped_count += 1
-        
-        # Sync recently closed/merged PRs (sorted by updated date to catch recent activity)
+
+        # Sync recently closed/merged PRs. The Search API applies the
+        # updated bound server-side, so only candidate PRs come over the
+        # wire instead of paginating the full closed list until it goes
+        # stale. Search has its own (much lower) rate limit, so fall back
+        # to walking the closed listing if it is unavailable.
         logger.info("Syncing closed/merged PRs...")
-        for pr in self.repo.get_pulls(state='closed', sort='updated', direction='desc'):
-            # Check updated_at since we want recently active closed PRs
-            if pr.updated_at < since:
-                # PRs sorted by updated_at desc, so break when we hit old ones
-                break
-            if self.sync_pull_request(pr, db):
-                synced_count += 1
-                if synced_count % 10 == 0:
-                    db.commit()
+        try:
+            query = f"repo:{settings.github_repo} is:pr is:closed updated:>={since.date().isoformat()}"
+            for chunk in _chunked(self.github.search_issues(query, sort='updated', order='desc'), 50):
+                batch = [issue.as_pull_request() for issue in chunk]
+                synced, skipped = self._fan_out_sync(batch)
+                synced_count += synced
+                skipped_count += skipped
+                logger.info(f"Synced {synced_count} PRs...")
+        except GithubException as e:
+            logger.warning(f"Search API unavailable ({e.status}), falling back to closed-PR listing")
+            stop_iteration = False
+            for chunk in _chunked(self.repo.get_pulls(state='closed', sort='updated', direction='desc'), 50):
+                batch = []
+                for pr in chunk:
+                    # Check updated_at since we want recently active closed PRs
+                    if pr.updated_at < since:
+                        # PRs sorted by updated_at desc, so stop when we hit old ones
+                        stop_iteration = True
+                        break
+                    batch.append(pr)
+                if batch:
+                    synced, skipped = self._fan_out_sync(batch)
+                    synced_count += synced
+                    skipped_count += skipped
                     logger.info(f"Synced {synced_count} PRs...")
-            else:
-                skipped_count += 1
-        
+                if stop_iteration:
+                    break
+
         db.commit()
         logger.info(f"Full sync completed: synced {synced_count} PRs, skipped {skipped_count}")
         
         # Update aggregated metrics
         logger.info("Updating aggregated metrics...")
-        self.update_developer_metrics(db)
-        self.update_reviewer_metrics(db)
-        self.update_domain_metrics(db)
-        self.update_interface_metrics(db)
+        self.update_all_metrics()
         logger.info("Metrics updated successfully")
         
         # Update last sync time
@@ -1076,376 +1478,642 @@ class GitHubService:
         
         return synced_count
     
-    def update_developer_metrics(self, db: Session):
-        """Update aggregated developer metrics."""
+    def update_all_metrics(self):
+        """Rebuild every aggregated metrics table concurrently.
+
+        The four update_*_metrics passes touch disjoint tables and are
+        DB-bound, so they run side by side on a small thread pool.
+        Sessions are not thread-safe, so each worker opens and closes
+        its own.
+        """
+        from database import SessionLocal
+
+        def run(update):
+            db = SessionLocal()
+            try:
+                update(db)
+            finally:
+                db.close()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            # list() surfaces the first worker exception, like the old
+            # sequential calls did
+            list(pool.map(run, [
+                self.update_developer_metrics,
+                self.update_reviewer_metrics,
+                self.update_domain_metrics,
+                self.update_interface_metrics,
+            ]))
+
+    def update_developer_metrics(self, db: Session, usernames: Optional[set] = None):
+        """Update aggregated developer metrics.
+
+        When `usernames` is given, only those developers are rebuilt.
+        """
+        from sqlalchemy import case, func
+
+        def scoped(query):
+            """Restrict a query to the requested developers, if any."""
+            if usernames is not None:
+                return query.filter(PullRequest.developer_username.in_(usernames))
+            return query
+
         developers = db.query(
             PullRequest.developer_username,
             PullRequest.author_login
         ).distinct().all()
-        
+
+        # Aggregate the counters in a few GROUP BY round-trips instead of
+        # materializing every PR row per developer in Python
+        agg_rows = scoped(db.query(
+            PullRequest.developer_username,
+            func.count(PullRequest.id).label('total'),
+            func.sum(case((PullRequest.state == 'open', 1), else_=0)).label('open'),
+            func.sum(case((PullRequest.merged == True, 1), else_=0)).label('merged'),
+            func.sum(case(((PullRequest.state == 'closed') & (PullRequest.merged == False), 1), else_=0)).label('closed'),
+            func.coalesce(func.sum(PullRequest.rework_count), 0).label('rework'),
+            func.coalesce(func.sum(PullRequest.check_failures), 0).label('check_failures')
+        )).group_by(PullRequest.developer_username).all()
+        dev_aggs = {row.developer_username: row for row in agg_rows}
+
+        domain_rows = scoped(db.query(
+            PullRequest.developer_username,
+            PullRequest.domain,
+            func.count(PullRequest.id)
+        ).filter(PullRequest.domain.isnot(None))).group_by(
+            PullRequest.developer_username, PullRequest.domain
+        ).all()
+        dev_domains = {}
+        for username, domain, count in domain_rows:
+            dev_domains.setdefault(username, {})[domain] = count
+
+        difficulty_rows = scoped(db.query(
+            PullRequest.developer_username,
+            PullRequest.difficulty,
+            func.count(PullRequest.id)
+        ).filter(PullRequest.difficulty.in_(['expert', 'hard', 'medium']))).group_by(
+            PullRequest.developer_username, PullRequest.difficulty
+        ).all()
+        dev_difficulties = {}
+        for username, difficulty, count in difficulty_rows:
+            dev_difficulties.setdefault(username, {})[difficulty] = count
+
+        # Five most recent PRs per developer, from one slim column query
+        recent_rows = scoped(db.query(
+            PullRequest.developer_username,
+            PullRequest.title,
+            PullRequest.state,
+            PullRequest.created_at
+        )).order_by(
+            PullRequest.developer_username, PullRequest.created_at.desc()
+        ).all()
+        dev_recent = {}
+        for username, title, state, created_at in recent_rows:
+            recent = dev_recent.setdefault(username, [])
+            if len(recent) < 5:
+                recent.append({
+                    'title': title,
+                    'state': state,
+                    'created_at': created_at.isoformat() if created_at else None
+                })
+
+        processed = 0
         for dev_username, github_login in developers:
             if not dev_username:
                 continue
-                
-            dev = db.query(Developer).filter_by(username=dev_username).first()
-            is_new = False
-            if not dev:
-                dev = Developer(username=dev_username, github_login=github_login)
-                is_new = True
-            
-            # Calculate metrics
-            prs = db.query(PullRequest).filter_by(developer_username=dev_username).all()
-            dev.total_prs = len(prs)
-            dev.open_prs = sum(1 for pr in prs if pr.state == 'open')
-            dev.merged_prs = sum(1 for pr in prs if pr.merged)
-            dev.closed_prs = sum(1 for pr in prs if pr.state == 'closed' and not pr.merged)
-            dev.total_rework = sum(pr.rework_count for pr in prs)
-            dev.total_check_failures = sum(pr.check_failures for pr in prs)
-            
-            # Calculate detailed metrics
-            metrics = {
-                'domains': {},
-                'difficulties': {'expert': 0, 'hard': 0, 'medium': 0},
-                'recent_prs': []
-            }
-            
-            for pr in prs:
-                # Count by domain
-                if pr.domain:
-                    metrics['domains'][pr.domain] = metrics['domains'].get(pr.domain, 0) + 1
-                
-                # Count by difficulty
-                if pr.difficulty in metrics['difficulties']:
-                    metrics['difficulties'][pr.difficulty] += 1
-                
-                # Add recent PRs
-                if len(metrics['recent_prs']) < 5:
-                    metrics['recent_prs'].append({
-                        'title': pr.title,
-                        'state': pr.state,
-                        'created_at': pr.created_at.isoformat() if pr.created_at else None
-                    })
-            
-            dev.metrics = metrics
-            dev.last_updated = datetime.now(timezone.utc)
-            
-            # Only add to session if it's a new developer
-            if is_new:
-                db.add(dev)
-            
-            # Commit after each developer to avoid bulk insert conflicts
+            if usernames is not None and dev_username not in usernames:
+                continue
+
+            # SAVEPOINT per developer keeps error isolation without paying
+            # a full transaction commit (WAL flush) per row
             try:
-                db.commit()
+                with db.begin_nested():
+                    dev = db.query(Developer).filter_by(username=dev_username).first()
+                    is_new = False
+                    if not dev:
+                        dev = Developer(username=dev_username, github_login=github_login)
+                        is_new = True
+
+                    # Apply the aggregates computed in SQL above
+                    agg = dev_aggs.get(dev_username)
+                    dev.total_prs = int(agg.total) if agg else 0
+                    dev.open_prs = int(agg.open or 0) if agg else 0
+                    dev.merged_prs = int(agg.merged or 0) if agg else 0
+                    dev.closed_prs = int(agg.closed or 0) if agg else 0
+                    dev.total_rework = int(agg.rework or 0) if agg else 0
+                    dev.total_check_failures = int(agg.check_failures or 0) if agg else 0
+
+                    difficulties = {'expert': 0, 'hard': 0, 'medium': 0}
+                    difficulties.update(dev_difficulties.get(dev_username, {}))
+                    dev.metrics = {
+                        'domains': dev_domains.get(dev_username, {}),
+                        'difficulties': difficulties,
+                        'recent_prs': dev_recent.get(dev_username, [])
+                    }
+                    dev.last_updated = datetime.now(timezone.utc)
+
+                    # Only add to session if it's a new developer
+                    if is_new:
+                        db.add(dev)
             except Exception as e:
-                db.rollback()
                 logger.warning(f"Error updating developer {dev_username}: {str(e)}")
                 continue
-    
-    def update_reviewer_metrics(self, db: Session):
-        """Update aggregated reviewer metrics."""
-        reviewers = db.query(Review.reviewer_login).distinct().all()
-        
-        for (reviewer_login,) in reviewers:
-            if not reviewer_login:
-                continue
-                
-            reviewer = db.query(Reviewer).filter_by(username=reviewer_login).first()
-            is_new = False
-            if not reviewer:
-                reviewer = Reviewer(username=reviewer_login)
-                is_new = True
-            
-            # Calculate metrics
-            reviews = db.query(Review).filter_by(reviewer_login=reviewer_login).all()
-            reviewer.total_reviews = len(reviews)
-            reviewer.approved_reviews = sum(1 for r in reviews if r.state == 'APPROVED')
-            reviewer.changes_requested = sum(1 for r in reviews if r.state == 'CHANGES_REQUESTED')
-            reviewer.commented_reviews = sum(1 for r in reviews if r.state == 'COMMENTED')
-            reviewer.dismissed_reviews = sum(1 for r in reviews if r.state == 'DISMISSED')
-            
-            # Calculate detailed metrics
-            metrics = {
-                'domains': {},
-                'recent_reviews': []
-            }
-            
-            for review in reviews[:20]:  # Last 20 reviews
-                pr = review.pull_request
-                if pr and pr.domain:
-                    metrics['domains'][pr.domain] = metrics['domains'].get(pr.domain, 0) + 1
-                
-                if len(metrics['recent_reviews']) < 5:
-                    metrics['recent_reviews'].append({
-                        'pr_title': pr.title if pr else 'Unknown',
-                        'state': review.state,
-                        'submitted_at': review.submitted_at.isoformat() if review.submitted_at else None
-                    })
-            
-            reviewer.metrics = metrics
-            reviewer.last_updated = datetime.now(timezone.utc)
-            
-            # Only add to session if it's a new reviewer
-            if is_new:
-                db.add(reviewer)
-            
-            # Commit after each reviewer to avoid bulk insert conflicts
-            try:
+
+            # Commit in batches instead of once per developer; expunge the
+            # committed rows so the identity map stays flat across the loop
+            processed += 1
+            if processed % 500 == 0:
                 db.commit()
-            except Exception as e:
-                db.rollback()
-                logger.warning(f"Error updating reviewer {reviewer_login}: {str(e)}")
-                continue
+                db.expunge_all()
+
+        db.commit()
     
-    def update_domain_metrics(self, db: Session):
-        """Update domain-level metrics."""
-        domains = db.query(PullRequest.domain).distinct().all()
-        
-        for (domain,) in domains:
-            if not domain:
-                continue
-                
-            domain_metric = db.query(DomainMetrics).filter_by(domain=domain).first()
-            is_new = False
-            if not domain_metric:
-                domain_metric = DomainMetrics(domain=domain)
-                is_new = True
-            
-            # Get all PRs for this domain
-            prs = db.query(PullRequest).filter_by(domain=domain).all()
-            domain_metric.total_tasks = len(prs)
-            
-            # Reset counts
-            domain_metric.expert_review_pending = 0
-            domain_metric.calibrator_review_pending = 0
-            domain_metric.expert_approved = 0
-            domain_metric.ready_to_merge = 0
-            domain_metric.merged = 0
-            domain_metric.expert_count = 0
-            domain_metric.hard_count = 0
-            domain_metric.medium_count = 0
-            
-            # Count by state and labels
-            for pr in prs:
-                if pr.merged:
-                    domain_metric.merged += 1
-                elif 'ready to merge' in [l.lower() for l in pr.labels]:
-                    domain_metric.ready_to_merge += 1
-                elif 'expert approved' in [l.lower() for l in pr.labels]:
-                    domain_metric.expert_approved += 1
-                elif 'calibrator review pending' in [l.lower() for l in pr.labels]:
-                    domain_metric.calibrator_review_pending += 1
-                elif 'expert review pending' in [l.lower() for l in pr.labels]:
-                    domain_metric.expert_review_pending += 1
-                
-                # Count by difficulty
-                if pr.difficulty == 'expert':
-                    domain_metric.expert_count += 1
-                elif pr.difficulty == 'hard':
-                    domain_metric.hard_count += 1
-                elif pr.difficulty == 'medium':
-                    domain_metric.medium_count += 1
-            
-            # Calculate detailed metrics
-            detailed = {
-                'developers': {},
-                'reviewers': {},
-                'weekly_trend': []
-            }
-            
-            # Count by developer
-            for pr in prs:
-                if pr.developer_username:
-                    detailed['developers'][pr.developer_username] = \
-                        detailed['developers'].get(pr.developer_username, 0) + 1
-            
-            # Count by reviewer
-            reviews = db.query(Review).join(PullRequest).filter(PullRequest.domain == domain).all()
-            for review in reviews:
-                if review.reviewer_login:
-                    detailed['reviewers'][review.reviewer_login] = \
-                        detailed['reviewers'].get(review.reviewer_login, 0) + 1
-            
-            domain_metric.detailed_metrics = detailed
-            domain_metric.last_updated = datetime.now(timezone.utc)
-            
-            # Only add to session if it's a new domain metric
-            if is_new:
-                db.add(domain_metric)
+    def update_reviewer_metrics(self, db: Session, reviewer_logins: Optional[set] = None):
+        """Update aggregated reviewer metrics.
+
+        When `reviewer_logins` is given, only those reviewers are rebuilt.
+        """
+        from collections import Counter
+        from sqlalchemy import case, func
+
+        with _no_expire_on_commit(db):
+            reviewers = db.query(Review.reviewer_login).distinct().all()
+
+            processed = 0
+            for (reviewer_login,) in reviewers:
+                if not reviewer_login:
+                    continue
+                if reviewer_logins is not None and reviewer_login not in reviewer_logins:
+                    continue
+
+                reviewer = db.query(Reviewer).filter_by(username=reviewer_login).first()
+                is_new = False
+                if not reviewer:
+                    reviewer = Reviewer(username=reviewer_login)
+                    is_new = True
+
+                # Aggregate the state counts in SQL instead of materializing
+                # every Review row
+                agg = db.query(
+                    func.count(Review.id).label('total'),
+                    func.sum(case((Review.state == 'APPROVED', 1), else_=0)).label('approved'),
+                    func.sum(case((Review.state == 'CHANGES_REQUESTED', 1), else_=0)).label('changes_requested'),
+                    func.sum(case((Review.state == 'COMMENTED', 1), else_=0)).label('commented'),
+                    func.sum(case((Review.state == 'DISMISSED', 1), else_=0)).label('dismissed')
+                ).filter(Review.reviewer_login == reviewer_login).one()
+                reviewer.total_reviews = int(agg.total)
+                reviewer.approved_reviews = int(agg.approved or 0)
+                reviewer.changes_requested = int(agg.changes_requested or 0)
+                reviewer.commented_reviews = int(agg.commented or 0)
+                reviewer.dismissed_reviews = int(agg.dismissed or 0)
+
+                # Last 20 reviews with their PR columns joined in - avoids a
+                # lazy pull_requests SELECT per review
+                recent_rows = db.query(
+                    Review.state,
+                    Review.submitted_at,
+                    PullRequest.title,
+                    PullRequest.domain
+                ).outerjoin(
+                    PullRequest, Review.pull_request_id == PullRequest.id
+                ).filter(
+                    Review.reviewer_login == reviewer_login
+                ).order_by(Review.submitted_at.desc()).limit(20).all()
+
+                # Counter skips the get-or-default dance on every increment
+                metrics = {
+                    'domains': dict(Counter(
+                        pr_domain for _, _, _, pr_domain in recent_rows if pr_domain
+                    )),
+                    'recent_reviews': [
+                        {
+                            'pr_title': pr_title if pr_title else 'Unknown',
+                            'state': state,
+                            'submitted_at': submitted_at.isoformat() if submitted_at else None
+                        }
+                        for state, submitted_at, pr_title, _ in recent_rows[:5]
+                    ]
+                }
+
+                reviewer.metrics = metrics
+                reviewer.last_updated = datetime.now(timezone.utc)
             
-            # Commit after each domain to avoid bulk insert conflicts
-            try:
-                db.commit()
-            except Exception as e:
-                db.rollback()
-                logger.warning(f"Error updating domain {domain}: {str(e)}")
-                continue
+                # Insert under a SAVEPOINT so a conflict only discards this
+                # reviewer, then commit in batches instead of once per reviewer
+                try:
+                    with db.begin_nested():
+                        if is_new:
+                            db.add(reviewer)
+                except Exception as e:
+                    logger.warning(f"Error updating reviewer {reviewer_login}: {str(e)}")
+                    continue
+
+                processed += 1
+                if processed % 100 == 0:
+                    db.commit()
+
+            db.commit()
+    
+    def update_domain_metrics(self, db: Session, domains: Optional[set] = None):
+        """Update domain-level metrics.
+
+        When `domains` is given, only those domains are rebuilt.
+        """
+        from collections import Counter, defaultdict
+        from sqlalchemy import case, func
+
+        with _no_expire_on_commit(db):
+            def scoped(query):
+                """Restrict a query to the requested domains, if any."""
+                if domains is not None:
+                    return query.filter(PullRequest.domain.in_(domains))
+                return query
+
+            # Totals, merged and difficulty counters for every domain in one
+            # GROUP BY round-trip instead of materializing each domain's PRs
+            agg_rows = scoped(db.query(
+                PullRequest.domain,
+                func.count(PullRequest.id).label('total'),
+                func.sum(case((PullRequest.merged == True, 1), else_=0)).label('merged'),
+                func.sum(case((PullRequest.difficulty == 'expert', 1), else_=0)).label('expert'),
+                func.sum(case((PullRequest.difficulty == 'hard', 1), else_=0)).label('hard'),
+                func.sum(case((PullRequest.difficulty == 'medium', 1), else_=0)).label('medium')
+            ).group_by(PullRequest.domain)).all()
+
+            # Developer and reviewer tallies, grouped once across all domains
+            dev_rows = scoped(db.query(
+                PullRequest.domain,
+                PullRequest.developer_username,
+                func.count(PullRequest.id)
+            ).group_by(PullRequest.domain, PullRequest.developer_username)).all()
+            devs_by_domain: Dict[str, Dict[str, int]] = defaultdict(dict)
+            for domain, username, count in dev_rows:
+                if domain and username:
+                    devs_by_domain[domain][username] = int(count)
+
+            reviewer_rows = scoped(db.query(
+                PullRequest.domain,
+                Review.reviewer_login,
+                func.count(Review.id)
+            ).join(PullRequest, Review.pull_request_id == PullRequest.id).group_by(
+                PullRequest.domain, Review.reviewer_login
+            )).all()
+            reviewers_by_domain: Dict[str, Dict[str, int]] = defaultdict(dict)
+            for domain, login, count in reviewer_rows:
+                if domain and login:
+                    reviewers_by_domain[domain][login] = int(count)
+
+            # The label-status chain has to stay in Python (labels live in a
+            # JSON column), but it only needs two slim columns per open PR
+            # Counter skips the get-or-default dance on every increment
+            status_counts: Dict[str, Counter] = defaultdict(Counter)
+            label_rows = scoped(db.query(
+                PullRequest.domain,
+                PullRequest.merged,
+                PullRequest.labels,
+                PullRequest.labels_lower
+            )).yield_per(500)
+            for domain, merged, labels, lowered in label_rows:
+                if not domain or merged:
+                    # Merged totals already come from the GROUP BY above
+                    continue
+                counts = status_counts[domain]
+                # labels_lower is populated at sync time; rows that predate the
+                # column fall back to lowercasing here
+                if lowered is None:
+                    lowered = [l.lower() for l in (labels or ())]
+                labels_lower = frozenset(lowered)
+                if labels_lower:
+                    hit = next((counter for label, counter in _DOMAIN_STATUS_PRIORITY
+                                if label in labels_lower), None)
+                    if hit:
+                        counts[hit] += 1
+
+            # Build the payload rows in memory and write them in one
+            # INSERT ... ON CONFLICT DO UPDATE: no per-domain SELECT to
+            # decide insert-vs-update, no is_new branch, one round-trip
+            now = datetime.now(timezone.utc)
+            rows = []
+            for agg in agg_rows:
+                domain = agg.domain
+                if not domain:
+                    continue
+                counts = status_counts.get(domain, {})
+                rows.append({
+                    'domain': domain,
+                    'total_tasks': int(agg.total),
+                    'merged': int(agg.merged or 0),
+                    'expert_count': int(agg.expert or 0),
+                    'hard_count': int(agg.hard or 0),
+                    'medium_count': int(agg.medium or 0),
+                    'ready_to_merge': counts.get('ready_to_merge', 0),
+                    'expert_approved': counts.get('expert_approved', 0),
+                    'calibrator_review_pending': counts.get('calibrator_review_pending', 0),
+                    'expert_review_pending': counts.get('expert_review_pending', 0),
+                    'detailed_metrics': {
+                        'developers': devs_by_domain.get(domain, {}),
+                        'reviewers': reviewers_by_domain.get(domain, {}),
+                        'weekly_trend': []
+                    },
+                    'last_updated': now
+                })
+
+            if rows:
+                stmt = pg_insert(DomainMetrics).values(rows)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=['domain'],
+                    set_={col: stmt.excluded[col] for col in rows[0] if col != 'domain'}
+                )
+                db.execute(stmt)
+            db.commit()
     
-    def update_interface_metrics(self, db: Session):
-        """Update interface-level metrics with weekly breakdown."""
+    def update_interface_metrics(self, db: Session, interface_nums: Optional[set] = None):
+        """Update interface-level metrics with weekly breakdown.
+
+        When `interface_nums` is given, only those interfaces are rebuilt.
+        """
         from datetime import datetime, timedelta
-        from collections import defaultdict
-        
-        interfaces = db.query(PullRequest.interface_num).distinct().all()
-        
-        for (interface_num,) in interfaces:
-            if interface_num is None:
-                continue
-                
-            interface_metric = db.query(InterfaceMetrics).filter_by(interface_num=interface_num).first()
-            is_new = False
-            if not interface_metric:
-                interface_metric = InterfaceMetrics(interface_num=interface_num)
-                is_new = True
-            
-            # Get all PRs for this interface
-            prs = db.query(PullRequest).filter_by(interface_num=interface_num).all()
-            interface_metric.total_tasks = len(prs)
-            
-            # Reset counts
-            interface_metric.discarded = 0
-            interface_metric.expert_approved = 0
-            interface_metric.expert_review_pending = 0
-            interface_metric.good_task = 0
-            interface_metric.merged = 0
-            interface_metric.pending_review = 0
-            interface_metric.pod_lead_approved = 0
-            interface_metric.ready_to_merge = 0
-            interface_metric.resubmitted = 0
-            interface_metric.rework = 0
-            
-            # Reset complexity counts
-            interface_metric.all_expert_count = 0
-            interface_metric.all_hard_count = 0
-            interface_metric.all_medium_count = 0
-            interface_metric.merged_expert_count = 0
-            interface_metric.merged_hard_count = 0
-            interface_metric.merged_medium_count = 0
-            
-            # Weekly stats structure
-            weekly_stats = defaultdict(lambda: {
-                'total': 0,
-                'merged': 0,
-                'statuses': defaultdict(int),
-                'complexity': defaultdict(int)
-            })
-            
-            # Process each PR
-            for pr in prs:
-                # Get week key (start of week)
-                week_start = pr.created_at - timedelta(days=pr.created_at.weekday())
-                week_key = week_start.strftime('%Y-%m-%d')
-                
-                # Update weekly stats
-                weekly_stats[week_key]['total'] += 1
-                if pr.complexity:
-                    weekly_stats[week_key]['complexity'][pr.complexity] += 1
-                
-                # Count PR statuses based on labels
-                pr_labels_lower = [l.lower() for l in pr.labels] if pr.labels else []
-                
-                if pr.merged:
-                    interface_metric.merged += 1
-                    weekly_stats[week_key]['merged'] += 1
-                    weekly_stats[week_key]['statuses']['merged'] += 1
-                    
-                    # Complexity distribution for merged
-                    if pr.complexity == 'expert':
-                        interface_metric.merged_expert_count += 1
-                    elif pr.complexity == 'hard':
-                        interface_metric.merged_hard_count += 1
-                    elif pr.complexity == 'medium':
-                        interface_metric.merged_medium_count += 1
-                else:
-                    # Complexity distribution for all non-merged
-                    if pr.complexity == 'expert':
-                        interface_metric.all_expert_count += 1
-                    elif pr.complexity == 'hard':
-                        interface_metric.all_hard_count += 1
-                    elif pr.complexity == 'medium':
-                        interface_metric.all_medium_count += 1
-                    
-                    # Count by label status
-                    if 'discarded' in pr_labels_lower:
-                        interface_metric.discarded += 1
-                        weekly_stats[week_key]['statuses']['discarded'] += 1
-                    elif 'ready to merge' in pr_labels_lower:
-                        interface_metric.ready_to_merge += 1
-                        weekly_stats[week_key]['statuses']['ready_to_merge'] += 1
-                    elif 'pod lead approved' in pr_labels_lower:
-                        interface_metric.pod_lead_approved += 1
-                        weekly_stats[week_key]['statuses']['pod_lead_approved'] += 1
-                    elif 'expert approved' in pr_labels_lower:
-                        interface_metric.expert_approved += 1
-                        weekly_stats[week_key]['statuses']['expert_approved'] += 1
-                    elif 'good task' in pr_labels_lower:
-                        interface_metric.good_task += 1
-                        weekly_stats[week_key]['statuses']['good_task'] += 1
-                    elif 'expert review pending' in pr_labels_lower:
-                        interface_metric.expert_review_pending += 1
-                        weekly_stats[week_key]['statuses']['expert_review_pending'] += 1
-                    elif 'pending review' in pr_labels_lower:
-                        interface_metric.pending_review += 1
-                        weekly_stats[week_key]['statuses']['pending_review'] += 1
-                    elif 'resubmitted' in pr_labels_lower:
-                        interface_metric.resubmitted += 1
-                        weekly_stats[week_key]['statuses']['resubmitted'] += 1
+        from collections import Counter
+        from sqlalchemy import case, func
+
+        with _no_expire_on_commit(db):
+            interfaces = db.query(PullRequest.interface_num).distinct().all()
+
+            # Aggregate the plain counters (totals, merged, rework, complexity
+            # distribution) in one GROUP BY round-trip instead of tallying per PR
+            # in Python. Label-based status counts stay in the Python loop below
+            # because labels live in a JSON column.
+            agg_rows = db.query(
+                PullRequest.interface_num,
+                func.count(PullRequest.id).label('total'),
+                func.sum(case((PullRequest.merged == True, 1), else_=0)).label('merged'),
+                func.coalesce(func.sum(PullRequest.rework_count), 0).label('rework'),
+                func.sum(case(((PullRequest.merged == True) & (PullRequest.complexity == 'expert'), 1), else_=0)).label('merged_expert'),
+                func.sum(case(((PullRequest.merged == True) & (PullRequest.complexity == 'hard'), 1), else_=0)).label('merged_hard'),
+                func.sum(case(((PullRequest.merged == True) & (PullRequest.complexity == 'medium'), 1), else_=0)).label('merged_medium'),
+                func.sum(case(((PullRequest.merged == False) & (PullRequest.complexity == 'expert'), 1), else_=0)).label('all_expert'),
+                func.sum(case(((PullRequest.merged == False) & (PullRequest.complexity == 'hard'), 1), else_=0)).label('all_hard'),
+                func.sum(case(((PullRequest.merged == False) & (PullRequest.complexity == 'medium'), 1), else_=0)).label('all_medium')
+            ).group_by(PullRequest.interface_num).all()
+            interface_aggs = {row.interface_num: row for row in agg_rows}
+
+            # Cache week keys by day ordinal - PRs created on the same day (and
+            # usually the same week) skip the timedelta math and string formatting
+            week_key_cache = {}
+
+            processed = 0
+            for (interface_num,) in interfaces:
+                if interface_num is None:
+                    continue
+                if interface_nums is not None and interface_num not in interface_nums:
+                    continue
                 
-                # Count rework (requested changes)
-                interface_metric.rework += pr.rework_count
-            
-            # Convert weekly_stats to regular dict for JSON storage
-            interface_metric.weekly_stats = dict(weekly_stats)
-            
-            # Calculate detailed metrics
-            detailed = {
-                'trainers': {},
-                'reviewers': {},
-                'domains': {},
-                'complexity_percentages': {
-                    'merged': {
-                        'expert': round((interface_metric.merged_expert_count / interface_metric.merged * 100) if interface_metric.merged > 0 else 0, 2),
-                        'hard': round((interface_metric.merged_hard_count / interface_metric.merged * 100) if interface_metric.merged > 0 else 0, 2),
-                        'medium': round((interface_metric.merged_medium_count / interface_metric.merged * 100) if interface_metric.merged > 0 else 0, 2)
-                    },
-                    'all_statuses': {
-                        'expert': round((interface_metric.all_expert_count / (interface_metric.total_tasks - interface_metric.merged) * 100) if (interface_metric.total_tasks - interface_metric.merged) > 0 else 0, 2),
-                        'hard': round((interface_metric.all_hard_count / (interface_metric.total_tasks - interface_metric.merged) * 100) if (interface_metric.total_tasks - interface_metric.merged) > 0 else 0, 2),
-                        'medium': round((interface_metric.all_medium_count / (interface_metric.total_tasks - interface_metric.merged) * 100) if (interface_metric.total_tasks - interface_metric.merged) > 0 else 0, 2)
+                interface_metric = db.query(InterfaceMetrics).filter_by(interface_num=interface_num).first()
+                is_new = False
+                if not interface_metric:
+                    interface_metric = InterfaceMetrics(interface_num=interface_num)
+                    is_new = True
+            
+                # Stream only the columns the loop reads, in batches, instead
+                # of materializing full ORM rows; the loop below is the only
+                # pass over them
+                prs = db.query(
+                    PullRequest.created_at,
+                    PullRequest.merged,
+                    PullRequest.complexity,
+                    PullRequest.labels,
+                    PullRequest.labels_lower
+                ).filter_by(interface_num=interface_num).yield_per(500)
+
+                # Apply the aggregates computed in SQL above. Keep plain
+                # locals too: the percentage block below reads them without
+                # paying the ORM descriptor lookup per access.
+                agg = interface_aggs.get(interface_num)
+                total_tasks = int(agg.total) if agg else 0
+                merged_total = int(agg.merged or 0) if agg else 0
+                merged_expert = int(agg.merged_expert or 0) if agg else 0
+                merged_hard = int(agg.merged_hard or 0) if agg else 0
+                merged_medium = int(agg.merged_medium or 0) if agg else 0
+                all_expert = int(agg.all_expert or 0) if agg else 0
+                all_hard = int(agg.all_hard or 0) if agg else 0
+                all_medium = int(agg.all_medium or 0) if agg else 0
+                interface_metric.total_tasks = total_tasks
+                interface_metric.merged = merged_total
+                interface_metric.rework = int(agg.rework or 0) if agg else 0
+                interface_metric.merged_expert_count = merged_expert
+                interface_metric.merged_hard_count = merged_hard
+                interface_metric.merged_medium_count = merged_medium
+                interface_metric.all_expert_count = all_expert
+                interface_metric.all_hard_count = all_hard
+                interface_metric.all_medium_count = all_medium
+
+                # Reset label-based status counts (recomputed in the loop below)
+                interface_metric.discarded = 0
+                interface_metric.expert_approved = 0
+                interface_metric.expert_review_pending = 0
+                interface_metric.good_task = 0
+                interface_metric.pending_review = 0
+                interface_metric.pod_lead_approved = 0
+                interface_metric.ready_to_merge = 0
+                interface_metric.resubmitted = 0
+            
+                # Weekly stats as a flat Counter keyed by (week, field[, name])
+                # - one dict instead of nested dicts allocated per new week;
+                # folded back into the nested JSON shape after the loop
+                weekly_counts = Counter()
+            
+                # Process each PR
+                for created_at, merged, complexity, labels, lowered in prs:
+                    # Get week key (start of week) - cached since strftime-style
+                    # formatting is expensive when called per PR
+                    day_ordinal = created_at.toordinal()
+                    week_key = week_key_cache.get(day_ordinal)
+                    if week_key is None:
+                        week_start = created_at.date() - timedelta(days=created_at.weekday())
+                        week_key = f"{week_start.year:04d}-{week_start.month:02d}-{week_start.day:02d}"
+                        week_key_cache[day_ordinal] = week_key
+
+                    # Update weekly stats
+                    weekly_counts[(week_key, 'total')] += 1
+                    if complexity:
+                        weekly_counts[(week_key, 'complexity', complexity)] += 1
+
+                    # Count PR statuses based on labels (pre-lowercased at sync
+                    # time; rows that predate the column fall back to lowering)
+                    if lowered is not None:
+                        pr_labels_lower = frozenset(lowered)
+                    else:
+                        pr_labels_lower = frozenset(l.lower() for l in labels) if labels else frozenset()
+
+                    if merged:
+                        weekly_counts[(week_key, 'merged')] += 1
+                        weekly_counts[(week_key, 'statuses', 'merged')] += 1
+                    elif pr_labels_lower:
+                        # Count by label status - first priority hit wins
+                        hit = next((counter for label, counter in _INTERFACE_STATUS_PRIORITY
+                                    if label in pr_labels_lower), None)
+                        if hit:
+                            setattr(interface_metric, hit, getattr(interface_metric, hit) + 1)
+                            weekly_counts[(week_key, 'statuses', hit)] += 1
+
+                # Fold the flat counts into the nested dict layout for JSON storage
+                weekly_stats = {}
+                for key, count in weekly_counts.items():
+                    week = weekly_stats.setdefault(
+                        key[0], {'total': 0, 'merged': 0, 'statuses': {}, 'complexity': {}}
+                    )
+                    if len(key) == 2:
+                        week[key[1]] = count
+                    else:
+                        week[key[1]][key[2]] = count
+                interface_metric.weekly_stats = weekly_stats
+            
+                # Calculate detailed metrics from the locals bound above
+                non_merged_total = total_tasks - merged_total
+                detailed = {
+                    'trainers': {},
+                    'reviewers': {},
+                    'domains': {},
+                    'complexity_percentages': {
+                        'merged': {
+                            'expert': _pct(merged_expert, merged_total),
+                            'hard': _pct(merged_hard, merged_total),
+                            'medium': _pct(merged_medium, merged_total)
+                        },
+                        'all_statuses': {
+                            'expert': _pct(all_expert, non_merged_total),
+                            'hard': _pct(all_hard, non_merged_total),
+                            'medium': _pct(all_medium, non_merged_total)
+                        }
                     }
                 }
-            }
-            
-            # Count by trainer and domain
-            for pr in prs:
-                if pr.trainer_name:
-                    detailed['trainers'][pr.trainer_name] = \
-                        detailed['trainers'].get(pr.trainer_name, 0) + 1
-                if pr.domain:
-                    detailed['domains'][pr.domain] = \
-                        detailed['domains'].get(pr.domain, 0) + 1
-            
-            # Count by reviewer
-            reviews = db.query(Review).join(PullRequest).filter(PullRequest.interface_num == interface_num).all()
-            for review in reviews:
-                if review.reviewer_login:
-                    detailed['reviewers'][review.reviewer_login] = \
-                        detailed['reviewers'].get(review.reviewer_login, 0) + 1
             
-            interface_metric.detailed_metrics = detailed
-            interface_metric.last_updated = datetime.now(timezone.utc)
-            
-            # Only add to session if it's a new interface metric
-            if is_new:
-                db.add(interface_metric)
+                # Count by trainer and domain - grouped in SQL rather than a
+                # second Python pass over the PR rows
+                trainer_rows = db.query(
+                    PullRequest.trainer_name, func.count(PullRequest.id)
+                ).filter(
+                    PullRequest.interface_num == interface_num,
+                    PullRequest.trainer_name.isnot(None)
+                ).group_by(PullRequest.trainer_name).all()
+                detailed['trainers'] = dict(trainer_rows)
+
+                domain_count_rows = db.query(
+                    PullRequest.domain, func.count(PullRequest.id)
+                ).filter(
+                    PullRequest.interface_num == interface_num,
+                    PullRequest.domain.isnot(None)
+                ).group_by(PullRequest.domain).all()
+                detailed['domains'] = dict(domain_count_rows)
+
+                # Count by reviewer - aggregate in SQL so only distinct reviewers
+                # cross the wire instead of every Review row
+                reviewer_rows = db.query(
+                    Review.reviewer_login, func.count(Review.id)
+                ).join(PullRequest).filter(
+                    PullRequest.interface_num == interface_num,
+                    Review.reviewer_login.isnot(None)
+                ).group_by(Review.reviewer_login).all()
+                detailed['reviewers'] = dict(reviewer_rows)
+
+                # Skip the write entirely when nothing changed since the last
+                # rebuild. The hash is order-sensitive, so a spurious mismatch
+                # only costs a redundant (but correct) update.
+                content_hash = hashlib.blake2b(repr((
+                    interface_metric.total_tasks,
+                    interface_metric.merged,
+                    interface_metric.rework,
+                    interface_metric.discarded,
+                    interface_metric.expert_approved,
+                    interface_metric.expert_review_pending,
+                    interface_metric.good_task,
+                    interface_metric.pending_review,
+                    interface_metric.pod_lead_approved,
+                    interface_metric.ready_to_merge,
+                    interface_metric.resubmitted,
+                    interface_metric.merged_expert_count,
+                    interface_metric.merged_hard_count,
+                    interface_metric.merged_medium_count,
+                    interface_metric.all_expert_count,
+                    interface_metric.all_hard_count,
+                    interface_metric.all_medium_count,
+                    weekly_stats,
+                    detailed
+                )).encode(), digest_size=16).hexdigest()
+                if not is_new and interface_metric.content_hash == content_hash:
+                    logger.debug(f"Interface {interface_num} metrics unchanged, skipping write")
+                    continue
+                interface_metric.content_hash = content_hash
+
+                interface_metric.detailed_metrics = detailed
+                interface_metric.last_updated = datetime.now(timezone.utc)
             
-            # Commit after each interface to avoid bulk insert conflicts
-            try:
-                db.commit()
-            except Exception as e:
-                db.rollback()
-                logger.warning(f"Error updating interface {interface_num}: {str(e)}")
-                continue
+                # Insert under a SAVEPOINT so a conflict only discards this
+                # interface, then commit in batches instead of once per interface
+                try:
+                    with db.begin_nested():
+                        if is_new:
+                            db.add(interface_metric)
+                except Exception as e:
+                    logger.warning(f"Error updating interface {interface_num}: {str(e)}")
+                    continue
+
+                processed += 1
+                if processed % 100 == 0:
+                    db.commit()
+
+            db.commit()
     
+    def _sync_pr_in_savepoint(self, pr, db: Session, skip_nested_data: bool = False) -> Optional[PullRequest]:
+        """Run sync_pull_request inside a SAVEPOINT.
+
+        A failure rolls back only this PR's changes; the surrounding
+        per-chunk transaction stays intact and is committed by the caller.
+        """
+        try:
+            with db.begin_nested():
+                return self.sync_pull_request(pr, db, skip_nested_data=skip_nested_data)
+        except Exception as e:
+            logger.warning(f"PR sync rolled back to savepoint: {str(e)}")
+            return None
+
+    def _sync_pr_worker(self, pr, skip_nested_data: bool = False) -> bool:
+        """Sync one PR on a dedicated session (used by the thread fan-out).
+
+        Sessions are not thread-safe, so each worker opens and commits its
+        own; the savepoint wrapper still isolates per-PR failures.
+        """
+        from database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            result = self._sync_pr_in_savepoint(pr, db, skip_nested_data=skip_nested_data)
+            db.commit()
+            return result is not None
+        except Exception as e:
+            logger.error(f"Error in threaded sync for PR #{pr.number}: {str(e)}")
+            db.rollback()
+            return False
+        finally:
+            db.close()
+
+    def _fan_out_sync(self, prs: List) -> Tuple[int, int]:
+        """Sync a batch of PRs concurrently on worker threads.
+
+        Each PR's sync is several serial GitHub round-trips, so overlapping
+        them dominates the wall time. Worker count stays modest to avoid
+        GitHub's secondary rate limit. Returns (synced, skipped).
+        """
+        synced = 0
+        skipped = 0
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for success in pool.map(self._sync_pr_worker, prs):
+                if success:
+                    synced += 1
+                else:
+                    skipped += 1
+        return synced, skipped
+
     def get_incremental_updates(self, db: Session, last_sync: datetime) -> int:
         """
         Get incremental updates since last sync.
@@ -1465,93 +2133,144 @@ class GitHubService:
             last_sync = last_sync.replace(tzinfo=timezone.utc)
         
         logger.info(f"Starting incremental sync for PRs updated after {last_sync}")
+
+        # One timestamp for the whole pass - rows touched by the same sync
+        # sharing a last_synced value is fine, and it saves a clock call per PR
+        now = datetime.now(timezone.utc)
+
+        # Fresh dirty tracking for this pass
+        self._reset_dirty()
         
         # Get recently updated PRs - explicitly sort by updated date descending
         # Note: PyGithub handles pagination automatically (100 PRs per page - set in __init__)
+        stop_iteration = False
         try:
-            for pr in self.repo.get_pulls(
-                state='all', 
-                sort='updated', 
+            # PRs are issues in GitHub's API, and get_issues supports a
+            # server-side `since` bound that get_pulls lacks - the server
+            # skips items older than last_sync instead of shipping them to
+            # us. The updated_at comparison below stays as a safety net.
+            for issue_chunk in _chunked(self.repo.get_issues(
+                state='all',
+                since=last_sync,
+                sort='updated',
                 direction='desc'
-            ):
-                checked_count += 1
-                
-                # Check if PR was updated after last sync
-                if pr.updated_at <= last_sync:
-                    # Since PRs are sorted by updated_at desc, once we hit an old PR,
-                    # all remaining PRs will be even older, so we can break
-                    logger.info(f"Reached PRs older than last sync at PR #{pr.number} (updated: {pr.updated_at})")
-                    break
-                
-                # Smart sync: Check what actually changed to avoid unnecessary API calls
-                db_pr = db.query(PullRequest).filter_by(github_id=pr.id).first()
-                
-                if db_pr:
-                    # PR exists - determine if we need full sync or just metadata update
-                    needs_full_sync = False
-                    skip_nested = False
-                    
-                    # Check if significant changes happened (these are FREE - no API calls)
-                    metadata_changed = (
-                        db_pr.state != pr.state or
-                        db_pr.merged != pr.merged or
-                        db_pr.title != pr.title
-                    )
-                    
-                    if metadata_changed:
-                        logger.debug(f"PR #{pr.number}: Metadata changed")
-                        needs_full_sync = True
-                    
-                    # Open PRs might have new commits/reviews - need to check
-                    if pr.state == 'open':
-                        logger.debug(f"PR #{pr.number}: Open PR, syncing updates")
-                        needs_full_sync = True
-                    
-                    # PR just closed/merged - do final sync with all data
-                    elif pr.state == 'closed' and db_pr.state == 'open':
-                        logger.info(f"PR #{pr.number}: Just closed/merged, doing final sync")
-                        needs_full_sync = True
-                    
-                    # Closed PR that was already closed - skip expensive nested data fetching
-                    elif pr.state == 'closed' and db_pr.state == 'closed' and db_pr.week_id:
-                        logger.debug(f"PR #{pr.number}: Closed PR with complete data, quick update")
-                        skip_nested = True
-                        needs_full_sync = True
-                    
-                    if not needs_full_sync:
-                        # No significant changes - just update timestamp and skip
-                        db_pr.last_synced = datetime.now(timezone.utc)
-                        skipped_count += 1
-                        logger.debug(f"PR #{pr.number}: No significant changes, skipping")
-                        continue
-                    
-                    # Sync with appropriate flags
-                    if self.sync_pull_request(pr, db, skip_nested_data=skip_nested):
-                        if skip_nested:
-                            quick_updates += 1
-                        else:
-                            synced_count += 1
-                        
-                        if (synced_count + quick_updates) % 10 == 0:
-                            db.commit()
-                            logger.info(f"Incremental sync progress: {synced_count} full, {quick_updates} quick, {skipped_count} skipped (checked {checked_count})")
-                    else:
-                        skipped_count += 1
-                else:
-                    # New PR - do full sync
-                    if self.sync_pull_request(pr, db):
-                        synced_count += 1
-                        if synced_count % 10 == 0:
-                            db.commit()
-                            logger.info(f"Incremental sync progress: {synced_count} new PRs synced")
+            ), 50):
+                # Plain issues come back too; resolve the survivors to
+                # their PR representation (issue ids differ from PR ids)
+                chunk = [
+                    issue.as_pull_request()
+                    for issue in issue_chunk
+                    if issue.pull_request is not None
+                ]
+                if not chunk:
+                    continue
+
+                # Batch the existence check: one IN (...) query per chunk
+                # instead of one SELECT per PR
+                existing_prs = {
+                    p.github_id: p
+                    for p in db.query(PullRequest).filter(
+                        PullRequest.github_id.in_([pr.id for pr in chunk])
+                    ).all()
+                }
+
+                # PRs needing a real sync are collected and fanned out below
+                to_sync = []
+
+                for pr in chunk:
+                    checked_count += 1
+
+                    # Check if PR was updated after last sync
+                    if pr.updated_at <= last_sync:
+                        # Since PRs are sorted by updated_at desc, once we hit an old PR,
+                        # all remaining PRs will be even older, so we can stop
+                        logger.info(f"Reached PRs older than last sync at PR #{pr.number} (updated: {pr.updated_at})")
+                        stop_iteration = True
+                        break
+
+                    # Smart sync: Check what actually changed to avoid unnecessary API calls
+                    db_pr = existing_prs.get(pr.id)
+
+                    if db_pr:
+                        # PR exists - determine if we need full sync or just metadata update
+                        needs_full_sync = False
+                        skip_nested = False
+
+                        # Check if significant changes happened (these are FREE - no API calls)
+                        metadata_changed = (
+                            db_pr.state != pr.state or
+                            db_pr.merged != pr.merged or
+                            db_pr.title != pr.title
+                        )
+
+                        if metadata_changed:
+                            logger.debug(f"PR #{pr.number}: Metadata changed")
+                            needs_full_sync = True
+
+                        # Open PRs might have new commits/reviews - need to check
+                        if pr.state == 'open':
+                            logger.debug(f"PR #{pr.number}: Open PR, syncing updates")
+                            needs_full_sync = True
+
+                        # PR just closed/merged - do final sync with all data
+                        elif pr.state == 'closed' and db_pr.state == 'open':
+                            logger.info(f"PR #{pr.number}: Just closed/merged, doing final sync")
+                            needs_full_sync = True
+
+                        # Closed PR that was already closed - skip expensive nested data fetching
+                        elif pr.state == 'closed' and db_pr.state == 'closed' and db_pr.week_id:
+                            logger.debug(f"PR #{pr.number}: Closed PR with complete data, quick update")
+                            skip_nested = True
+                            needs_full_sync = True
+
+                        if not needs_full_sync:
+                            # No significant changes - just update timestamp and skip
+                            db_pr.last_synced = now
+                            skipped_count += 1
+                            logger.debug(f"PR #{pr.number}: No significant changes, skipping")
+                            continue
+
+                        to_sync.append((pr, skip_nested))
                     else:
-                        skipped_count += 1
-                
-                # Safety limit to prevent runaway syncs (reduced from 500)
-                if checked_count > 200:
-                    logger.warning(f"Checked 200 PRs, stopping incremental sync. Consider less frequent syncs or full sync.")
+                        # New PR - do full sync
+                        to_sync.append((pr, False))
+
+                    # Safety limit to prevent runaway syncs (reduced from 500)
+                    if checked_count > 200:
+                        logger.warning(f"Checked 200 PRs, stopping incremental sync. Consider less frequent syncs or full sync.")
+                        stop_iteration = True
+                        break
+
+                # Fan out the per-PR syncs - each involves several GitHub
+                # round-trips, so overlapping them dominates the wall time.
+                # Workers use their own sessions; worker count stays modest
+                # to avoid GitHub's secondary rate limit.
+                if to_sync:
+                    with ThreadPoolExecutor(max_workers=8) as pool:
+                        futures = [
+                            pool.submit(self._sync_pr_worker, pr, skip_nested)
+                            for pr, skip_nested in to_sync
+                        ]
+                        for (pr, skip_nested), future in zip(to_sync, futures):
+                            if future.result():
+                                if skip_nested:
+                                    quick_updates += 1
+                                else:
+                                    synced_count += 1
+                            else:
+                                skipped_count += 1
+
+                # One commit per chunk for the timestamp-only updates above.
+                # Expunge what the chunk loaded so the identity map stays
+                # flat instead of accumulating every PR row for the run -
+                # the next chunk re-queries what it needs anyway.
+                db.commit()
+                db.expunge_all()
+                logger.info(f"Incremental sync progress: {synced_count} full, {quick_updates} quick, {skipped_count} skipped (checked {checked_count})")
+
+                if stop_iteration:
                     break
-                    
+
         except Exception as e:
             logger.error(f"Error during incremental sync: {str(e)}")
             db.rollback()
@@ -1561,13 +2280,20 @@ class GitHubService:
         
         logger.info(f"Incremental sync complete: {synced_count} full syncs, {quick_updates} quick updates, {skipped_count} skipped, {checked_count} checked total")
         
-        # Update metrics if we synced any PRs
+        # Update metrics if we synced any PRs - scoped to the entities the
+        # sync actually touched, so a few changed PRs rebuild a few rows
+        # instead of every metric table
         if synced_count > 0 or quick_updates > 0:
             logger.info("Updating aggregated metrics...")
-            self.update_developer_metrics(db)
-            self.update_reviewer_metrics(db)
-            self.update_domain_metrics(db)
-            self.update_interface_metrics(db)
+            dirty = self._dirty
+            if dirty['developers']:
+                self.update_developer_metrics(db, usernames=dirty['developers'])
+            if dirty['reviewers']:
+                self.update_reviewer_metrics(db, reviewer_logins=dirty['reviewers'])
+            if dirty['domains']:
+                self.update_domain_metrics(db, domains=dirty['domains'])
+            if dirty['interfaces']:
+                self.update_interface_metrics(db, interface_nums=dirty['interfaces'])
             logger.info("Metrics updated successfully")
         
         # ALWAYS update last sync time, even if no updates found
@@ -1577,39 +2303,62 @@ class GitHubService:
         
         return synced_count + quick_updates  # Total number of PRs updated
     
-    def parse_task_filename(self, filename: str) -> Optional[Dict]:
-        """Parse task filename to extract trainer, domain, interface, complexity, and timestamp."""
-        # Remove .json extension if present
-        name = filename.replace('.json', '')
-        match = self.task_file_pattern.match(name)
-        if match:
+    def _parse_task_name_uncached(self, name: str) -> Optional[Tuple]:
+        """Field split + malformed-domain fixup behind the per-instance LRU."""
+        # Fast path: with exactly four dashes the five fields split
+        # unambiguously, so plain string ops replace the backtracking
+        # regex. Names with extra dashes (trainer/domain ambiguity) keep
+        # the regex's non-greedy resolution.
+        trainer_name = None
+        if name.count('-') == 4:
+            t, d, iface, cpx, ts = name.split('-')
+            if (t and d and iface.isdigit()
+                    and cpx in ('expert', 'hard', 'medium')
+                    and len(ts) == 10 and ts.isdigit()):
+                trainer_name, domain, interface_num, complexity, timestamp = t, d, int(iface), cpx, ts
+
+        if trainer_name is None:
+            match = TASK_FILE_PATTERN.match(name)
+            if not match:
+                return None
             trainer_name = match.group(1)
             domain = match.group(2)
             interface_num = int(match.group(3))
             complexity = match.group(4)
             timestamp = match.group(5)
-            
-            # Fix malformed domains (same logic as parse_pr_title)
-            domain_normalized = domain.replace('-', '_')
-            
-            if domain_normalized in self.valid_domains:
-                domain = domain_normalized
-            elif domain in ['expert', 'experts', 'hard', 'medium', 'management', 'payroll', 'finance', 'wiki', 'home', 'incident']:
-                parts = trainer_name.split('-')
-                if len(parts) > 1:
-                    potential_prefix = parts[-1]
-                    potential_domain = f"{potential_prefix}_{domain}"
-                    if potential_domain in self.valid_domains:
-                        trainer_name = '-'.join(parts[:-1])
-                        domain = potential_domain
-            
-            return {
-                'trainer_name': trainer_name,
-                'domain': domain,
-                'interface_num': interface_num,
-                'complexity': complexity,
-                'timestamp': timestamp,
-                'filename': filename
-            }
-        return None
+
+        # Fix malformed domains (same logic as parse_pr_title)
+        domain_normalized = domain.replace('-', '_')
+
+        if domain_normalized in self.valid_domains:
+            domain = domain_normalized
+        elif domain in _SUSPICIOUS_DOMAINS:
+            prefix, sep, last = trainer_name.rpartition('-')
+            if sep:
+                fixed = self._malformed_fix.get((last, domain))
+                if fixed:
+                    trainer_name = prefix
+                    domain = fixed
+
+        return (trainer_name, domain, interface_num, complexity, timestamp)
+
+    def parse_task_filename(self, filename: str) -> Optional[Dict]:
+        """Parse task filename to extract trainer, domain, interface, complexity, and timestamp."""
+        # Remove .json extension if present
+        name = filename.removesuffix('.json')
+        # Cheap reject before the regex: a matching name needs 4+ dashes
+        if name.count('-') < 4:
+            return None
+        parsed = self._parse_task_name(name)
+        if parsed is None:
+            return None
+        trainer_name, domain, interface_num, complexity, timestamp = parsed
+        return {
+            'trainer_name': trainer_name,
+            'domain': domain,
+            'interface_num': interface_num,
+            'complexity': complexity,
+            'timestamp': timestamp,
+            'filename': filename
+        }
 
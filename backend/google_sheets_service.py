@@ -3,16 +3,85 @@ Google Sheets Service - Fetch and merge data from Google Sheets
 """
 import logging
 import json
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
 import gspread
 from google.oauth2.service_account import Credentials
+from sqlalchemy import literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from database import DeveloperHierarchy
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Cached credentials/client shared across service instances. Building
+# credentials re-parses the PEM and signs a JWT, and authorizing fetches an
+# OAuth token; none of that needs to happen again while the token is valid
+# (the Credentials object refreshes itself when it expires).
+_client_lock = threading.Lock()
+_cached_credentials = None
+_cached_client = None
+
+# Service-account info built once; settings are static for the process
+# lifetime, so the private-key newline substitution never needs re-running
+_sa_info = None
+
+# On-disk cache of last-fetched sheet payloads, keyed by Drive modifiedTime
+_SHEET_CACHE_DIR = Path.home() / '.cache' / 'tau-dashboard' / 'sheets'
+
+# Normalized Sheet 2 row: strip/lower happens once at lookup-build time
+SheetRow = namedtuple('SheetRow', 'github_user role lead')
+
+def _pick_header(rows, *aliases):
+    """
+    Resolve which header alias a sheet actually uses by inspecting the
+    first row, so builder loops do a single .get(key) per row instead of
+    chained alias lookups.
+    """
+    header = rows[0] if rows else {}
+    for alias in aliases:
+        if alias in header:
+            return alias
+    return aliases[0]
+
+
+# Roles we recognize; anything else is normalized to 'Others'
+_ALLOWED_ROLES = frozenset({'Team Leader', 'Trainer', 'Calibrator', 'Pod Lead'})
+
+
+def _trainer_hierarchy(email, lead_email, lead_of):
+    # Trainer's Lead is their POD Lead; Calibrator is the POD Lead's Lead
+    # (a single probe of the precomputed email -> lead map)
+    return (lead_email if lead_email else None), lead_of.get(lead_email)
+
+
+def _pod_lead_hierarchy(email, lead_email, lead_of):
+    # POD Lead's own email is their pod_lead_email; their Lead is their Calibrator
+    return email, (lead_email if lead_email else None)
+
+
+def _calibrator_hierarchy(email, lead_email, lead_of):
+    # Calibrator's own email is their calibrator_email
+    return None, email
+
+
+def _team_leader_hierarchy(email, lead_email, lead_of):
+    # Team Leader at the top - no hierarchy above them
+    return None, email
+
+
+# Dispatch on lowercased role instead of an if/elif chain of .lower() compares
+_HIERARCHY_HANDLERS = {
+    'trainer': _trainer_hierarchy,
+    'pod lead': _pod_lead_hierarchy,
+    'calibrator': _calibrator_hierarchy,
+    'team leader': _team_leader_hierarchy,
+}
+
 class GoogleSheetsService:
     def __init__(self):
         """Initialize Google Sheets service with service account credentials from environment"""
@@ -23,14 +92,18 @@ class GoogleSheetsService:
         self.sheet2_url = "https://docs.google.com/spreadsheets/d/12WSKMXbzSMa0e5Jy0_xQK_eV5NF4Kn9v-PKQhqhxgQQ/edit?gid=0#gid=0"
     
     def _get_service_account_info(self) -> Dict:
-        """Build service account info from environment variables"""
+        """Build service account info from environment variables (built once)"""
+        global _sa_info
+        if _sa_info is not None:
+            return _sa_info
+
         if not settings.google_private_key:
             raise ValueError("Google Sheets credentials not configured. Set GOOGLE_* environment variables.")
-        
+
         # Replace literal \n in the private key with actual newlines
         private_key = settings.google_private_key.replace('\\n', '\n')
-        
-        return {
+
+        _sa_info = {
             "type": settings.google_service_account_type,
             "project_id": settings.google_project_id,
             "private_key_id": settings.google_private_key_id,
@@ -43,92 +116,141 @@ class GoogleSheetsService:
             "client_x509_cert_url": settings.google_client_cert_url,
             "universe_domain": settings.google_universe_domain
         }
-    
+        return _sa_info
+
     def connect(self):
-        """Connect to Google Sheets API using credentials from environment variables"""
+        """Connect to Google Sheets API, reusing the cached client when possible"""
+        global _cached_credentials, _cached_client
         try:
-            scopes = [
-                'https://www.googleapis.com/auth/spreadsheets.readonly',
-                'https://www.googleapis.com/auth/drive.readonly'
-            ]
-            
-            # Get service account info from environment variables
-            service_account_info = self._get_service_account_info()
-            
-            # Create credentials from the dictionary
-            credentials = Credentials.from_service_account_info(
-                service_account_info,
-                scopes=scopes
-            )
-            
-            self.client = gspread.authorize(credentials)
-            logger.info("Successfully connected to Google Sheets API using environment credentials")
-            return True
-            
+            with _client_lock:
+                # Reuse the shared client while its token is still valid
+                if _cached_client is not None and _cached_credentials is not None and _cached_credentials.valid:
+                    self.client = _cached_client
+                    return True
+
+                scopes = [
+                    'https://www.googleapis.com/auth/spreadsheets.readonly',
+                    'https://www.googleapis.com/auth/drive.readonly'
+                ]
+
+                # Get service account info from environment variables
+                service_account_info = self._get_service_account_info()
+
+                # Create credentials from the dictionary
+                credentials = Credentials.from_service_account_info(
+                    service_account_info,
+                    scopes=scopes
+                )
+
+                self.client = gspread.authorize(credentials)
+                _cached_credentials = credentials
+                _cached_client = self.client
+                logger.info("Successfully connected to Google Sheets API using environment credentials")
+                return True
+
         except Exception as e:
             logger.error(f"Failed to connect to Google Sheets: {e}")
             raise
     
+    def _fetch_records(self, sheet_url: str, tab_name: str) -> List[Dict]:
+        """
+        Fetch a worksheet's raw values in a single batch call and build
+        records locally. Avoids get_all_records(), which costs an extra
+        worksheet-metadata round-trip plus per-row header inspection.
+
+        Results are cached on disk keyed by the spreadsheet's Drive
+        modifiedTime: when the sheet hasn't changed since the last sync,
+        one cheap metadata call replaces the full values fetch.
+        """
+        if not self.client:
+            self.connect()
+
+        spreadsheet = self.client.open_by_url(sheet_url)
+
+        # Drive metadata probe is ~one field; failures just bypass the cache
+        try:
+            modified_time = spreadsheet.lastUpdateTime
+        except Exception as e:
+            logger.debug(f"Could not read modifiedTime for {tab_name}: {e}")
+            modified_time = None
+
+        cache_file = _SHEET_CACHE_DIR / f"{spreadsheet.id}_{tab_name.replace(' ', '_')}.json"
+        if modified_time and cache_file.exists():
+            try:
+                cached = json.loads(cache_file.read_text())
+                if cached.get('modified_time') == modified_time:
+                    logger.info(f"Using cached values for '{tab_name}' (unchanged since {modified_time})")
+                    return cached['records']
+            except (ValueError, KeyError, OSError) as e:
+                logger.debug(f"Ignoring unreadable sheet cache {cache_file}: {e}")
+
+        response = spreadsheet.values_batch_get(ranges=[f"'{tab_name}'!A:Z"])
+        values = response['valueRanges'][0].get('values', [])
+
+        if not values:
+            return []
+
+        header = values[0]
+        width = len(header)
+        # Pad short rows so every record has all header keys (matches
+        # get_all_records() behaviour for trailing empty cells)
+        records = [dict(zip(header, row + [''] * (width - len(row)))) for row in values[1:]]
+
+        if modified_time:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(json.dumps({'modified_time': modified_time, 'records': records}))
+            except OSError as e:
+                logger.debug(f"Could not write sheet cache {cache_file}: {e}")
+
+        return records
+
     def fetch_sheet1_data(self) -> List[Dict]:
         """
         Fetch data from Sheet 1 (Amazon Agentic List)
         Columns: Turing Email, Role, Pod Lead, Calibrator
         """
         try:
-            if not self.client:
-                self.connect()
-            
-            # Open spreadsheet and get the specific tab
-            spreadsheet = self.client.open_by_url(self.sheet1_url)
-            worksheet = spreadsheet.worksheet("Amazon Agentic List")
-            
-            # Get all records as list of dictionaries
-            records = worksheet.get_all_records()
-            
+            records = self._fetch_records(self.sheet1_url, "Amazon Agentic List")
             logger.info(f"Fetched {len(records)} records from Sheet 1")
             return records
-            
+
         except Exception as e:
             logger.error(f"Error fetching Sheet 1 data: {e}")
             raise
-    
+
     def fetch_sheet2_data(self) -> List[Dict]:
         """
         Fetch data from Sheet 2 (GitHub users)
         Columns: Email, Github User
         """
         try:
-            if not self.client:
-                self.connect()
-            
-            # Open spreadsheet and get the specific tab
-            spreadsheet = self.client.open_by_url(self.sheet2_url)
-            worksheet = spreadsheet.worksheet("Sheet1")
-            
-            # Get all records as list of dictionaries
-            records = worksheet.get_all_records()
-            
+            records = self._fetch_records(self.sheet2_url, "Sheet1")
             logger.info(f"Fetched {len(records)} records from Sheet 2")
             return records
-            
+
         except Exception as e:
             logger.error(f"Error fetching Sheet 2 data: {e}")
             raise
     
     def merge_sheets_data(self) -> List[Dict]:
+        """Materialized form of iter_merged_data() for callers that need a list"""
+        return list(self.iter_merged_data())
+
+    def iter_merged_data(self) -> Iterator[Dict]:
         """
         Merge data from both sheets based on email and calculate hierarchy
-        
+
         PRIMARY SOURCE: Sheet 2 (Email, GitHub, Role, Lead)
         SECONDARY SOURCE: Sheet 1 (Status only)
-        
+
         Transformation logic:
         - For Trainers: POD Lead = their Lead, Calibrator = Lead's Lead
         - For POD Leads: POD Lead = themselves, Calibrator = their Lead
         - For Calibrators: Calibrator = themselves (or their Lead if they report to Team Leader)
         - For Team Leaders: At the top of hierarchy
-        
-        Returns list of dicts with:
+
+        Yields dicts with:
         - turing_email
         - github_user
         - role
@@ -137,91 +259,91 @@ class GoogleSheetsService:
         - calibrator_email
         """
         try:
-            sheet1_data = self.fetch_sheet1_data()
-            sheet2_data = self.fetch_sheet2_data()
-            
+            # Authorize once, then fetch both sheets in parallel - each fetch
+            # is a blocking HTTPS round-trip, so overlapping them roughly
+            # halves the wall-clock latency
+            if not self.client:
+                self.connect()
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                sheet1_future = executor.submit(self.fetch_sheet1_data)
+                sheet2_future = executor.submit(self.fetch_sheet2_data)
+                sheet1_data = sheet1_future.result()
+                sheet2_data = sheet2_future.result()
+
+            # Resolve each sheet's header aliases once up front
+            s1_email_key = _pick_header(sheet1_data, 'Turing Email', 'turing_email')
+            s1_status_key = _pick_header(sheet1_data, 'Status', 'status')
+            s2_email_key = _pick_header(sheet2_data, 'Email', 'email', '       Email')
+            s2_github_key = _pick_header(sheet2_data, 'Github User', 'github_user', 'GitHub User')
+            s2_role_key = _pick_header(sheet2_data, 'Role', 'role')
+            s2_lead_key = _pick_header(sheet2_data, 'Lead', 'lead')
+
             # Create mapping from Sheet 1: email -> status only
             sheet1_status = {}
             for row in sheet1_data:
-                turing_email = (row.get('Turing Email') or row.get('turing_email', '')).strip().lower()
-                status = (row.get('Status') or row.get('status', '')).strip()
-                
+                turing_email = (row.get(s1_email_key) or '').strip().lower()
+                status = (row.get(s1_status_key) or '').strip()
+
                 if turing_email:
                     sheet1_status[turing_email] = status
             
             logger.info(f"Created Sheet 1 status mapping with {len(sheet1_status)} entries")
             
-            # Create email-to-record lookup from Sheet 2 for hierarchy resolution
+            # Create email-to-record lookup from Sheet 2 for hierarchy resolution.
+            # Each row is normalized exactly once into a compact namedtuple;
+            # the merge loop below reads attributes instead of re-stripping
             sheet2_lookup = {}
             for row in sheet2_data:
-                email = (row.get('Email') or row.get('email') or row.get('       Email', '')).strip().lower()
+                email = (row.get(s2_email_key) or '').strip().lower()
                 if email:
-                    sheet2_lookup[email] = {
-                        'github_user': (row.get('Github User') or row.get('github_user') or row.get('GitHub User', '')).strip(),
-                        'role': (row.get('Role') or row.get('role', '')).strip(),
-                        'lead': (row.get('Lead') or row.get('lead', '')).strip().lower()
-                    }
-            
+                    sheet2_lookup[email] = SheetRow(
+                        github_user=(row.get(s2_github_key) or '').strip(),
+                        role=(row.get(s2_role_key) or '').strip(),
+                        lead=(row.get(s2_lead_key) or '').strip().lower()
+                    )
+
             logger.info(f"Created Sheet 2 lookup with {len(sheet2_lookup)} entries")
-            
-            # Define allowed roles (normalize to these)
-            allowed_roles = ['Team Leader', 'Trainer', 'Calibrator', 'Pod Lead']
-            
-            # Process Sheet 2 data and calculate hierarchy
-            merged_data = []
+
+            # Index the email -> lead edge once so the trainer case resolves
+            # its two-hop calibrator with a single dict probe, no branching
+            lead_of = {email: (rec.lead or None) for email, rec in sheet2_lookup.items()}
+
+
+            # Process Sheet 2 data and calculate hierarchy, yielding rows as
+            # they are produced so the sync loop never holds a second copy
+            merged_count = 0
             for email, data in sheet2_lookup.items():
-                
-                github_user = data['github_user'] if data['github_user'] else None
-                role = data['role']
-                lead_email = data['lead']
+
+                github_user = data.github_user if data.github_user else None
+                role = data.role
+                lead_email = data.lead
                 
                 # Normalize role - if not in allowed list, set to 'Others'
-                if role not in allowed_roles:
+                if role not in _ALLOWED_ROLES:
                     role = 'Others'
-                
+
                 # Get status from Sheet 1 (optional)
                 status = sheet1_status.get(email, '')
-                
-                pod_lead_email = None
-                calibrator_email = None
-                
-                if role.lower() == 'trainer':
-                    # Trainer's Lead is their POD Lead
-                    pod_lead_email = lead_email if lead_email else None
-                    
-                    # Calibrator is the Lead of the POD Lead
-                    if lead_email and lead_email in sheet2_lookup:
-                        pod_lead_record = sheet2_lookup[lead_email]
-                        pod_lead_lead = pod_lead_record['lead']
-                        calibrator_email = pod_lead_lead if pod_lead_lead else None
-                
-                elif role.lower() == 'pod lead':
-                    # POD Lead's own email is their pod_lead_email
-                    pod_lead_email = email
-                    # Their Lead is their Calibrator
-                    calibrator_email = lead_email if lead_email else None
-                
-                elif role.lower() == 'calibrator':
-                    # Calibrator's own email is their calibrator_email
-                    calibrator_email = email
-                    # Their Lead (if Team Leader) can be stored separately if needed
-                
-                elif role.lower() == 'team leader':
-                    # Team Leader at the top - no hierarchy above them
-                    calibrator_email = email
-                
-                merged_data.append({
+
+                handler = _HIERARCHY_HANDLERS.get(role.lower())
+                if handler:
+                    pod_lead_email, calibrator_email = handler(email, lead_email, lead_of)
+                else:
+                    pod_lead_email = None
+                    calibrator_email = None
+
+                merged_count += 1
+                yield {
                     'turing_email': email,
                     'github_user': github_user,
                     'role': role,
                     'status': status,
                     'pod_lead_email': pod_lead_email,
                     'calibrator_email': calibrator_email
-                })
-            
-            logger.info(f"Merged {len(merged_data)} records (Sheet 2 primary, Sheet 1 status)")
-            return merged_data
-            
+                }
+
+            logger.info(f"Merged {merged_count} records (Sheet 2 primary, Sheet 1 status)")
+
         except Exception as e:
             logger.error(f"Error merging sheets data: {e}")
             raise
@@ -233,72 +355,78 @@ class GoogleSheetsService:
         Returns: (inserted_count, updated_count, error_count)
         """
         try:
-            merged_data = self.merge_sheets_data()
-            
             inserted_count = 0
             updated_count = 0
-            error_count = 0
-            
-            # Track to handle duplicates (keep first occurrence)
+
+
+            # Track to handle duplicates (keep first occurrence); duplicates
+            # are tallied and logged in aggregate instead of one warning each
             seen_github_users = set()
             seen_emails = set()
-            
-            for item in merged_data:
-                try:
-                    github_user = item.get('github_user', '').strip() or None  # Convert empty string to None
-                    turing_email = item.get('turing_email', '').strip()
-                    
-                    # Skip if missing critical field (turing_email is required, github_user is optional)
-                    if not turing_email:
-                        logger.warning(f"Skipping record with missing turing_email: {item}")
-                        error_count += 1
-                        continue
-                    
-                    # Skip duplicate emails (primary identifier)
-                    if turing_email in seen_emails:
-                        logger.warning(f"Skipping duplicate email in batch: {turing_email} ({github_user})")
-                        error_count += 1
-                        continue
-                    
-                    # Skip duplicate github_user (only if not None)
-                    if github_user and github_user in seen_github_users:
-                        logger.warning(f"Skipping duplicate GitHub username in batch: {github_user} ({turing_email})")
-                        error_count += 1
-                        continue
-                    
-                    seen_emails.add(turing_email)
-                    if github_user:
-                        seen_github_users.add(github_user)
-                    
-                    # Check if record exists (by email, which is unique)
-                    existing = db.query(DeveloperHierarchy).filter_by(turing_email=turing_email).first()
-                    
-                    if existing:
-                        # Update existing record
-                        existing.github_user = github_user  # Update github_user (might be None)
-                        existing.role = item.get('role')
-                        existing.status = item.get('status')
-                        existing.pod_lead_email = item.get('pod_lead_email')
-                        existing.calibrator_email = item.get('calibrator_email')
-                        updated_count += 1
-                    else:
-                        # Insert new record
-                        new_hierarchy = DeveloperHierarchy(
-                            github_user=github_user,  # Can be None
-                            turing_email=turing_email,
-                            role=item.get('role'),
-                            status=item.get('status'),
-                            pod_lead_email=item.get('pod_lead_email'),
-                            calibrator_email=item.get('calibrator_email')
-                        )
-                        db.add(new_hierarchy)
-                        inserted_count += 1
-                    
-                except Exception as e:
-                    logger.error(f"Error processing record {item}: {e}")
-                    error_count += 1
+            missing_email = 0
+            dup_emails = 0
+            dup_github_users = 0
+
+            # Collect rows for a single INSERT ... ON CONFLICT DO UPDATE,
+            # collapsing the read-then-write cycle into one statement
+            rows = []
+
+            for item in self.iter_merged_data():
+                # Values arrive pre-normalized from iter_merged_data (stripped,
+                # emails lowercased, empty github_user already None)
+                github_user = item.get('github_user')
+                turing_email = item.get('turing_email') or ''
+
+                # Skip if missing critical field (turing_email is required, github_user is optional)
+                if not turing_email:
+                    missing_email += 1
                     continue
-            
+
+                # Skip duplicate emails (primary identifier)
+                if turing_email in seen_emails:
+                    dup_emails += 1
+                    continue
+
+                # Skip duplicate github_user (only if not None)
+                if github_user and github_user in seen_github_users:
+                    dup_github_users += 1
+                    continue
+
+                seen_emails.add(turing_email)
+                if github_user:
+                    seen_github_users.add(github_user)
+
+                rows.append({
+                    'turing_email': turing_email,
+                    'github_user': github_user,  # Can be None
+                    'role': item.get('role'),
+                    'status': item.get('status'),
+                    'pod_lead_email': item.get('pod_lead_email'),
+                    'calibrator_email': item.get('calibrator_email')
+                })
+
+            error_count = missing_email + dup_emails + dup_github_users
+            if error_count:
+                logger.warning(
+                    f"Dropped {missing_email} records missing turing_email, "
+                    f"{dup_emails} duplicate emails, {dup_github_users} duplicate GitHub usernames"
+                )
+
+            update_cols = ('github_user', 'role', 'status', 'pod_lead_email', 'calibrator_email')
+            for start in range(0, len(rows), 1000):
+                chunk = rows[start:start + 1000]
+                stmt = pg_insert(DeveloperHierarchy).values(chunk)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=['turing_email'],
+                    set_={col: stmt.excluded[col] for col in update_cols}
+                )
+                # xmax = 0 means the row was freshly inserted, not updated
+                result = db.execute(stmt.returning(literal_column('xmax = 0')))
+                for (was_insert,) in result:
+                    if was_insert:
+                        inserted_count += 1
+                    else:
+                        updated_count += 1
             db.commit()
             logger.info(f"Sync complete: {inserted_count} inserted, {updated_count} updated, {error_count} errors")
             
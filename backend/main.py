@@ -1,14 +1,17 @@
 from fastapi import FastAPI, Depends, HTTPException, WebSocket, WebSocketDisconnect, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func, Float
 from pydantic import BaseModel
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta, timezone
 import asyncio
+import functools
 import json
 import logging
+import threading
+import time
 from contextlib import asynccontextmanager
 from concurrent.futures import ThreadPoolExecutor
 
@@ -36,24 +39,83 @@ sync_executor = ThreadPoolExecutor(max_workers=3)
 # Track active sync tasks for graceful shutdown
 active_sync_tasks = set()
 
+# Guard against overlapping /api/sync triggers; also served by /api/sync/status
+_sync_status = {'running': False, 'started_at': None, 'sync_type': None, 'description': None}
+
+# In-process TTL cache for read-heavy GET endpoints. The epoch is part of
+# every key and gets bumped when a sync finishes, so fresh data shows up
+# immediately instead of waiting out the TTL.
+_read_cache: dict = {}
+_read_cache_lock = threading.Lock()
+_read_cache_epoch = 0
+
+def _bump_read_cache_epoch():
+    global _read_cache_epoch
+    with _read_cache_lock:
+        _read_cache_epoch += 1
+        _read_cache.clear()
+
+def _ttl_cached(seconds: int):
+    """Cache an endpoint's result keyed by its query params for `seconds`.
+
+    The db session kwarg is excluded from the key; the dashboard re-requests
+    these slow-moving payloads on every UI render, so identical responses
+    within the window are served without touching the database.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = (
+                fn.__name__,
+                _read_cache_epoch,
+                tuple(sorted((k, repr(v)) for k, v in kwargs.items() if k != 'db'))
+            )
+            now = time.monotonic()
+            hit = _read_cache.get(key)
+            if hit is not None and hit[0] > now:
+                return hit[1]
+            result = fn(*args, **kwargs)
+            with _read_cache_lock:
+                _read_cache[key] = (now + seconds, result)
+            return result
+        return wrapper
+    return decorator
+
 # WebSocket connection manager
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
-    
+        # Set-backed registry: connect/disconnect are O(1) and dead sockets
+        # can be removed wholesale after a broadcast
+        self.active_connections: set = set()
+        self._lock = asyncio.Lock()
+
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
-    
+        async with self._lock:
+            self.active_connections.add(websocket)
+
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
-    
+        self.active_connections.discard(websocket)
+
     async def broadcast(self, message: dict):
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except:
-                pass
+        connections = list(self.active_connections)
+        if not connections:
+            return
+        # Serialize once - send_json would re-encode the same dict per client -
+        # and fan the sends out concurrently instead of paying each RTT in turn
+        payload = json.dumps(message)
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in connections),
+            return_exceptions=True
+        )
+        dead = {
+            connection
+            for connection, result in zip(connections, results)
+            if isinstance(result, Exception)
+        }
+        if dead:
+            async with self._lock:
+                self.active_connections -= dead
 
 manager = ConnectionManager()
 
@@ -216,7 +278,10 @@ app = FastAPI(
     title="TAU Dashboard API",
     description="Dashboard for tracking PR metrics",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serializes the large list responses (/api/prs, /api/developers)
+    # several times faster than the stdlib encoder
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware - import settings at the top of this file
@@ -423,27 +488,38 @@ def read_root():
 
 @app.get("/api/overview", response_model=DashboardOverview)
 @app.get("/api/dashboard", response_model=DashboardOverview)  # Alias for compatibility
+@_ttl_cached(30)
 def get_dashboard_overview(db: Session = Depends(get_db)):
     """Get overall dashboard metrics."""
     try:
         from config import settings
-        
-        total_prs = db.query(PullRequest).count()
-        open_prs = db.query(PullRequest).filter_by(state='open').count()
-        merged_prs = db.query(PullRequest).filter_by(merged=True).count()
-        
-        total_developers = db.query(Developer).count()
-        total_reviewers = db.query(Reviewer).count()
+        from sqlalchemy import case
+
+        # One conditional-aggregate round-trip for all PR-level numbers
+        total_prs, open_prs, merged_prs, avg_rework = db.query(
+            func.count(PullRequest.id),
+            func.sum(case((PullRequest.state == 'open', 1), else_=0)),
+            func.sum(case((PullRequest.merged == True, 1), else_=0)),
+            func.avg(PullRequest.rework_count)
+        ).one()
+        total_prs = total_prs or 0
+        open_prs = open_prs or 0
+        merged_prs = merged_prs or 0
+        avg_rework = avg_rework or 0
+
+        # Entity counts as scalar subqueries in a single round-trip
+        total_developers, total_reviewers = db.query(
+            db.query(func.count(Developer.id)).scalar_subquery(),
+            db.query(func.count(Reviewer.id)).scalar_subquery()
+        ).one()
         # Count all allowed domains from config (not just those with PRs)
         total_domains = len(settings.allowed_domains)
-        
-        # Calculate average rework
-        avg_rework = db.query(PullRequest).with_entities(
-            func.avg(PullRequest.rework_count)
-        ).scalar() or 0
-        
-        # Get recent activity
-        recent_prs = db.query(PullRequest).order_by(
+
+        # Get recent activity (projected columns; no full ORM hydration)
+        recent_prs = db.query(
+            PullRequest.title, PullRequest.state,
+            PullRequest.developer_username, PullRequest.created_at
+        ).order_by(
             PullRequest.created_at.desc()
         ).limit(10).all()
         
@@ -460,17 +536,42 @@ def get_dashboard_overview(db: Session = Depends(get_db)):
             total_domains=total_domains,
             average_rework=round(avg_rework, 2),
             recent_activity=[{
-                'title': pr.title,
-                'state': pr.state,
-                'developer': pr.developer_username,
-                'created_at': pr.created_at.isoformat() if pr.created_at else None
-            } for pr in recent_prs],
+                'title': title,
+                'state': state,
+                'developer': developer_username,
+                'created_at': created_at.isoformat() if created_at else None
+            } for title, state, developer_username, created_at in recent_prs],
             last_sync_time=last_sync_time
         )
     except Exception as e:
         logger.error(f"Error getting overview: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def _construct_from_orm(model_cls, obj):
+    """
+    Build a response model straight from ORM attributes via model_construct,
+    skipping validation - the values come from typed columns the schema
+    mirrors, and fields the row lacks keep their schema defaults.
+    """
+    values = {f: getattr(obj, f) for f in model_cls.model_fields if hasattr(obj, f)}
+    return model_cls.model_construct(**values)
+
+def _approx_count(db: Session, table_name: str) -> Optional[int]:
+    """
+    Planner row estimate for an unfiltered table count.
+    Reads pg_class.reltuples (kept fresh by autovacuum/analyze) instead of
+    scanning the table; returns None when no usable estimate exists so the
+    caller can fall back to a real COUNT(*).
+    """
+    from sqlalchemy import text
+    estimate = db.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE relname = :t"),
+        {"t": table_name}
+    ).scalar()
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
+
 @app.get("/api/developers", response_model=PaginatedDevelopers)
 def get_developer_metrics(
     limit: int = 200,  # Increased default limit
@@ -598,10 +699,16 @@ def get_developer_metrics(
             if github_usernames:
                 conditions.append(Developer.username.in_(github_usernames))
             query = query.filter(or_(*conditions))
-        
-        # Get total count after filters
-        total = query.count()
-        
+
+        # Get total count - use the planner estimate when unfiltered so every
+        # page doesn't pay a full scan just to echo the table size
+        if search:
+            total = query.count()
+        else:
+            total = _approx_count(db, 'developers')
+            if total is None:
+                total = query.count()
+
         # Apply sorting with order direction
         from sqlalchemy import desc, asc, Float
         order_func = desc if sort_order.lower() == "desc" else asc
@@ -677,20 +784,17 @@ def get_developer_details(username: str, db: Session = Depends(get_db)):
     if not developer:
         raise HTTPException(status_code=404, detail="Developer not found")
     
-    # Get recent PRs
-    recent_prs = db.query(PullRequest).filter_by(
+    # Get recent PRs (projected columns; no full ORM hydration)
+    recent_prs = db.query(
+        PullRequest.title, PullRequest.state, PullRequest.labels,
+        PullRequest.rework_count, PullRequest.created_at
+    ).filter_by(
         developer_username=username
     ).order_by(PullRequest.created_at.desc()).limit(10).all()
+
+    developer.metrics['recent_prs'] = [row._asdict() for row in recent_prs]
     
-    developer.metrics['recent_prs'] = [{
-        'title': pr.title,
-        'state': pr.state,
-        'labels': pr.labels,
-        'rework_count': pr.rework_count,
-        'created_at': pr.created_at
-    } for pr in recent_prs]
-    
-    return DeveloperMetrics.from_orm(developer)
+    return _construct_from_orm(DeveloperMetrics, developer)
 
 @app.get("/api/reviewers", response_model=PaginatedReviewers)
 def get_reviewer_metrics(
@@ -803,21 +907,23 @@ def get_reviewer_metrics(
                 # Get pending reviews from pre-calculated map
                 pending_reviews_count = pending_reviews_map.get(result.username, 0)
                 
-                # Get recent reviews in this domain
-                recent_reviews = db.query(Review).join(
+                # Get recent reviews in this domain (project columns to skip ORM hydration)
+                recent_reviews = db.query(
+                    PullRequest.title, Review.state, Review.submitted_at
+                ).join(
                     PullRequest, Review.pull_request_id == PullRequest.id
                 ).filter(
                     Review.reviewer_login == result.username,
                     PullRequest.domain == domain
                 ).order_by(Review.submitted_at.desc()).limit(5).all()
-                
+
                 recent_reviews_list = [
                     {
-                        'pr_title': db.query(PullRequest).filter_by(id=review.pull_request_id).first().title if db.query(PullRequest).filter_by(id=review.pull_request_id).first() else 'N/A',
-                        'state': review.state,
-                        'submitted_at': review.submitted_at.isoformat() if review.submitted_at else None
+                        'pr_title': pr_title or 'N/A',
+                        'state': state,
+                        'submitted_at': submitted_at.isoformat() if submitted_at else None
                     }
-                    for review in recent_reviews
+                    for pr_title, state, submitted_at in recent_reviews
                 ]
                 
                 reviewers_data.append({
@@ -863,10 +969,16 @@ def get_reviewer_metrics(
             if github_usernames:
                 conditions.append(Reviewer.username.in_(github_usernames))
             query = query.filter(or_(*conditions))
-        
-        # Get total count after filters
-        total = query.count()
-        
+
+        # Get total count - use the planner estimate when unfiltered so every
+        # page doesn't pay a full scan just to echo the table size
+        if search:
+            total = query.count()
+        else:
+            total = _approx_count(db, 'reviewers')
+            if total is None:
+                total = query.count()
+
         # Apply sorting with order direction
         from sqlalchemy import desc, asc, text
         order_func = desc if sort_order.lower() == "desc" else asc
@@ -934,20 +1046,22 @@ def get_reviewer_metrics(
             # Get pending reviews from pre-calculated map
             reviewer_dict['metrics']['pending_reviews'] = pending_reviews_map.get(reviewer.username, 0)
             
-            # Add recent reviews
-            recent_reviews = db.query(Review).join(
+            # Add recent reviews (project columns to skip ORM hydration)
+            recent_reviews = db.query(
+                PullRequest.title, Review.state, Review.submitted_at
+            ).join(
                 PullRequest, Review.pull_request_id == PullRequest.id
             ).filter(
                 Review.reviewer_login == reviewer.username
             ).order_by(Review.submitted_at.desc()).limit(5).all()
-            
+
             reviewer_dict['metrics']['recent_reviews'] = [
                 {
-                    'pr_title': db.query(PullRequest).filter_by(id=review.pull_request_id).first().title if db.query(PullRequest).filter_by(id=review.pull_request_id).first() else 'N/A',
-                    'state': review.state,
-                    'submitted_at': review.submitted_at.isoformat() if review.submitted_at else None
+                    'pr_title': pr_title or 'N/A',
+                    'state': state,
+                    'submitted_at': submitted_at.isoformat() if submitted_at else None
                 }
-                for review in recent_reviews
+                for pr_title, state, submitted_at in recent_reviews
             ]
             
             enriched_reviewers.append(reviewer_dict)
@@ -982,6 +1096,7 @@ def get_statuses_list(db: Session = Depends(get_db)):
 
 
 @app.get("/api/domains", response_model=List[DomainMetricsResponse])
+@_ttl_cached(30)
 def get_domain_metrics(db: Session = Depends(get_db)):
     """Get metrics for ALL allowed domains (includes domains with 0 PRs), sorted by GitHub creation date (newest first)."""
     from database import Domain
@@ -1008,7 +1123,7 @@ def get_domain_metrics(db: Session = Depends(get_db)):
         for domain_name in settings.allowed_domains:
             if domain_name in metrics_map:
                 # Domain has metrics, use them
-                result.append(DomainMetricsResponse.from_orm(metrics_map[domain_name]))
+                result.append(_construct_from_orm(DomainMetricsResponse, metrics_map[domain_name]))
             else:
                 # Domain has no PRs yet, create empty metrics
                 domain_db = domain_db_map.get(domain_name)
@@ -1124,34 +1239,39 @@ def get_domain_details(domain: str, db: Session = Depends(get_db)):
     if not domain_metrics:
         raise HTTPException(status_code=404, detail="Domain not found")
     
-    # Get recent PRs for this domain
-    recent_prs = db.query(PullRequest).filter_by(
+    # Get recent PRs for this domain (projected columns; no full ORM hydration)
+    recent_prs = db.query(
+        PullRequest.title, PullRequest.state, PullRequest.labels,
+        PullRequest.developer_username, PullRequest.created_at
+    ).filter_by(
         domain=domain
     ).order_by(PullRequest.created_at.desc()).limit(20).all()
-    
+
     domain_metrics.detailed_metrics['recent_prs'] = [{
-        'title': pr.title,
-        'state': pr.state,
-        'labels': pr.labels,
-        'developer': pr.developer_username,
-        'created_at': pr.created_at
-    } for pr in recent_prs]
+        'title': title,
+        'state': state,
+        'labels': labels,
+        'developer': developer_username,
+        'created_at': created_at
+    } for title, state, labels, developer_username, created_at in recent_prs]
     
-    return DomainMetricsResponse.from_orm(domain_metrics)
+    return _construct_from_orm(DomainMetricsResponse, domain_metrics)
 
 @app.get("/api/pr-states", response_model=PRStateDistribution)
+@_ttl_cached(30)
 def get_pr_state_distribution(
     domain: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """Get PR state distribution by labels."""
     try:
-        query = db.query(PullRequest)
+        # The bucket is classified once at sync time (pr_state_bucket), so
+        # the distribution is a GROUP BY returning ~6 rows instead of
+        # hydrating every PR and re-checking labels in Python
+        query = db.query(PullRequest.pr_state_bucket, func.count())
         if domain:
             query = query.filter_by(domain=domain)
-        
-        prs = query.all()
-        
+
         distribution = {
             'expert_review_pending': 0,
             'calibrator_review_pending': 0,
@@ -1160,25 +1280,16 @@ def get_pr_state_distribution(
             'merged': 0,
             'other': 0
         }
-        
-        for pr in prs:
-            if pr.merged:
-                distribution['merged'] += 1
-            elif 'ready to merge' in [l.lower() for l in pr.labels]:
-                distribution['ready_to_merge'] += 1
-            elif 'expert approved' in [l.lower() for l in pr.labels]:
-                distribution['expert_approved'] += 1
-            elif 'calibrator review pending' in [l.lower() for l in pr.labels]:
-                distribution['calibrator_review_pending'] += 1
-            elif 'expert review pending' in [l.lower() for l in pr.labels]:
-                distribution['expert_review_pending'] += 1
-            else:
-                distribution['other'] += 1
-        
+
+        total = 0
+        for bucket, count in query.group_by(PullRequest.pr_state_bucket).all():
+            distribution[bucket if bucket in distribution else 'other'] += count
+            total += count
+
         return PRStateDistribution(
             domain=domain,
             distribution=distribution,
-            total=len(prs)
+            total=total
         )
     except Exception as e:
         logger.error(f"Error getting PR state distribution: {str(e)}")
@@ -1191,9 +1302,16 @@ def get_pull_requests(
     developer: Optional[str] = None,
     limit: int = 50,
     offset: int = 0,
+    after_created_at: Optional[datetime] = None,
+    after_id: Optional[int] = None,
     db: Session = Depends(get_db)
 ):
-    """Get pull requests with filters."""
+    """Get pull requests with filters.
+
+    Pagination: pass after_created_at/after_id from the last row of the
+    previous page for keyset paging (an index range-seek); offset remains
+    supported but scans and discards `offset` rows on every page.
+    """
     try:
         query = db.query(PullRequest)
         
@@ -1226,7 +1344,23 @@ def get_pull_requests(
             
             query = query.filter(or_(*conditions))
         
-        prs = query.order_by(PullRequest.created_at.desc()).offset(offset).limit(limit).all()
+        if after_created_at is not None:
+            # Keyset pagination: seek directly past the previous page's last
+            # row instead of discarding `offset` rows
+            from sqlalchemy import tuple_
+            if after_id is not None:
+                query = query.filter(
+                    tuple_(PullRequest.created_at, PullRequest.id) < (after_created_at, after_id)
+                )
+            else:
+                query = query.filter(PullRequest.created_at < after_created_at)
+            prs = query.order_by(
+                PullRequest.created_at.desc(), PullRequest.id.desc()
+            ).limit(limit).all()
+        else:
+            prs = query.order_by(
+                PullRequest.created_at.desc(), PullRequest.id.desc()
+            ).offset(offset).limit(limit).all()
         
         # Enrich PRs with turing_email
         result = []
@@ -1332,6 +1466,10 @@ def _perform_sync(db_url: str, since_days: int, force_full: bool):
         
         logger.info(f"Sync completed successfully - {sync_type} sync processed {count} PRs")
         
+        # New data just landed - expire the read caches now rather than
+        # letting them age out
+        _bump_read_cache_epoch()
+
         return {
             'count': count,
             'sync_type': sync_type,
@@ -1361,7 +1499,18 @@ async def trigger_sync(
     """
     try:
         from config import settings
-        
+
+        # Deduplicate concurrent triggers: a second POST while a sync is
+        # running would just compete for the same rate limit and DB rows
+        if _sync_status['running']:
+            return {
+                "status": "already_running",
+                "message": "A sync is already in progress",
+                "sync_type": _sync_status['sync_type'],
+                "description": _sync_status['description'],
+                "started_at": _sync_status['started_at']
+            }
+
         # Determine sync type and description
         do_full_sync = request.force_full or should_do_full_sync(db, request.since_days)
         sync_type = "full" if do_full_sync else "incremental"
@@ -1426,10 +1575,20 @@ async def trigger_sync(
                     'data': {'error': str(e)}
                 })
             finally:
+                _sync_status.update(running=False)
                 # Remove task from active set
                 if task in active_sync_tasks:
                     active_sync_tasks.discard(task)
-        
+
+        # Mark running before yielding to the loop so a racing trigger
+        # sees the guard immediately
+        _sync_status.update(
+            running=True,
+            started_at=datetime.now(timezone.utc).isoformat(),
+            sync_type=sync_type,
+            description=sync_desc
+        )
+
         # Start sync in background (don't await)
         task = asyncio.create_task(run_sync_and_notify())
         active_sync_tasks.add(task)
@@ -1448,6 +1607,11 @@ async def trigger_sync(
         logger.error(f"Traceback: {traceback.format_exc()}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/sync/status")
+def get_sync_status():
+    """Report whether a sync is currently running (cheap poll for the UI)."""
+    return dict(_sync_status)
+
 def normalize_domain(domain: str) -> str:
     """Normalize domain name - return recognized domain or 'Others'
     
@@ -1906,12 +2070,15 @@ async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
     try:
         while True:
-            # Keep connection alive
-            await asyncio.sleep(1)
+            # Suspend until the client sends a frame or disconnects - no
+            # periodic wakeups while the connection sits idle. Inbound
+            # frames are treated as keepalives and ignored.
+            await websocket.receive_text()
     except WebSocketDisconnect:
         manager.disconnect(websocket)
 
 @app.get("/api/stats/timeline")
+@_ttl_cached(30)
 def get_timeline_stats(
     days: int = 30,
     domain: Optional[str] = None,
@@ -1922,30 +2089,31 @@ def get_timeline_stats(
         end_date = datetime.now(timezone.utc)
         start_date = end_date - timedelta(days=days)
         
-        query = db.query(PullRequest).filter(
+        from sqlalchemy import case
+
+        # Bucket by day in SQL: the database returns at most `days` rows
+        # instead of every PR in the window
+        day = func.date_trunc('day', PullRequest.created_at).label('day')
+        query = db.query(
+            day,
+            func.count().label('created'),
+            func.sum(case((PullRequest.merged == True, 1), else_=0)).label('merged'),
+            func.sum(PullRequest.rework_count).label('rework')
+        ).filter(
             PullRequest.created_at >= start_date
         )
-        
+
         if domain:
             query = query.filter_by(domain=domain)
-        
-        prs = query.all()
-        
-        # Group by day
-        timeline = {}
-        for pr in prs:
-            date_key = pr.created_at.strftime('%Y-%m-%d')
-            if date_key not in timeline:
-                timeline[date_key] = {
-                    'created': 0,
-                    'merged': 0,
-                    'rework': 0
-                }
-            
-            timeline[date_key]['created'] += 1
-            if pr.merged:
-                timeline[date_key]['merged'] += 1
-            timeline[date_key]['rework'] += pr.rework_count
+
+        timeline = {
+            row.day.strftime('%Y-%m-%d'): {
+                'created': row.created,
+                'merged': int(row.merged or 0),
+                'rework': int(row.rework or 0)
+            }
+            for row in query.group_by(day).all()
+        }
         
         return {
             'dates': sorted(timeline.keys()),
@@ -2017,6 +2185,10 @@ def get_interface_metrics(
 
 # NOTE: Specific routes must come BEFORE parameterized routes to avoid conflicts
 
+# Valid complexity levels - used to index complexity counter dicts directly
+# instead of walking an if/elif chain per PR
+COMPLEXITY_LEVELS = frozenset({'expert', 'hard', 'medium'})
+
 @app.get("/api/interfaces/filtered")
 def get_filtered_interface_metrics(
     week_id: int = None,
@@ -2088,12 +2260,8 @@ def get_filtered_interface_metrics(
             if pr.merged:
                 stats['merged'] += 1
                 status_counts['merged'] += 1
-                if pr.complexity == 'expert':
-                    stats['complexity']['merged']['expert'] += 1
-                elif pr.complexity == 'hard':
-                    stats['complexity']['merged']['hard'] += 1
-                elif pr.complexity == 'medium':
-                    stats['complexity']['merged']['medium'] += 1
+                if pr.complexity in COMPLEXITY_LEVELS:
+                    stats['complexity']['merged'][pr.complexity] += 1
             elif pr.state == 'open':
                 stats['open'] += 1
                 status_counts['open'] += 1
@@ -2114,12 +2282,8 @@ def get_filtered_interface_metrics(
                 stats['rework'] += pr.rework_count
             
             # All statuses complexity
-            if pr.complexity == 'expert':
-                stats['complexity']['all']['expert'] += 1
-            elif pr.complexity == 'hard':
-                stats['complexity']['all']['hard'] += 1
-            elif pr.complexity == 'medium':
-                stats['complexity']['all']['medium'] += 1
+            if pr.complexity in COMPLEXITY_LEVELS:
+                stats['complexity']['all'][pr.complexity] += 1
         
         # Convert to list and calculate percentages
         interfaces = []